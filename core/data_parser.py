@@ -15,6 +15,66 @@ import re
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:        # optional – the NumPy decoder is used instead
+    njit = None
+
+
+# 10^e for every exponent an ASCII sample can carry (−99 … +99).
+_POW10 = tuple(10.0 ** e for e in range(-99, 100))
+_POW10_ARR = np.array(_POW10)
+
+# Fields of an ASCII 'Timestamp' metadata line
+_TS_SEC = re.compile(r"(\d+)\s*s\b")
+_TS_MS = re.compile(r"(\d+)\s*ms")
+_TS_BUF = re.compile(r"(\d+)\s*%")
+
+# One or more back-to-back 'DDDDSZZ\r\n' sample records (9 chars each),
+# starting at the beginning of a line.
+_SAMPLE_RUN = re.compile(r"^(?:[0-9]{4}[-+][0-9]{2}\r\n)+", re.MULTILINE)
+
+# 1 / 16^n for every neg_pow16 a regular sample can carry (0x0–0xE).
+_POW16_INV = 16.0 ** -np.arange(16, dtype=np.float64)
+
+
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def _decode_bin(buf, start, out, pow16_inv):
+        """Decode 2-byte samples from buf[start:] into out.
+
+        Stops at the first lead byte of the form 0xFx (metadata or stray
+        byte) and returns (n_samples, next_pos).
+        """
+        n = 0
+        pos = start
+        end = buf.shape[0] - 1
+        while pos < end:
+            b1 = buf[pos]
+            if b1 >= 0xF0:
+                break
+            out[n] = (((b1 & 0x0F) << 8) | buf[pos + 1]) * pow16_inv[b1 >> 4]
+            n += 1
+            pos += 2
+        return n, pos
+
+    @njit(nogil=True, cache=True)
+    def _decode_ascii(rec, out, pow10):
+        """Decode pre-validated 9-byte 'DDDDSZZ\\r\\n' records into out."""
+        for i in range(rec.shape[0] // 9):
+            p = i * 9
+            mantissa = ((rec[p] - 48) * 1000 + (rec[p + 1] - 48) * 100
+                        + (rec[p + 2] - 48) * 10 + (rec[p + 3] - 48))
+            exponent = (rec[p + 5] - 48) * 10 + (rec[p + 6] - 48)
+            if rec[p + 4] == 0x2D:     # '-'
+                exponent = -exponent
+            out[i] = mantissa * pow10[exponent + 99]
+else:
+    _decode_bin = None
+    _decode_ascii = None
+
 
 # ---------------------------------------------------------------------------
 # Shared result container
@@ -24,8 +84,9 @@ from typing import List, Optional, Tuple
 class ParsedData:
     """Holds all parsed output from one chunk of raw serial data."""
 
-    samples: List[float] = field(default_factory=list)
-    """Current / energy values in Amperes (or Joules for energy output)."""
+    samples: List[np.ndarray] = field(default_factory=list)
+    """Non-empty float64 chunks of current / energy values in Amperes (or
+    Joules for energy output), in stream order.  See as_array()."""
 
     ack_lines: List[Tuple[bool, str, str]] = field(default_factory=list)
     """(success, command_name, payload) for every ack/err line."""
@@ -33,14 +94,41 @@ class ParsedData:
     errors: List[str] = field(default_factory=list)
     """Error messages embedded in the data stream."""
 
-    timestamps: List[Tuple[int, int]] = field(default_factory=list)
-    """(time_ms, buffer_percent) from every timestamp metadata record."""
+    timestamps: List[Tuple[int, int, int]] = field(default_factory=list)
+    """(time_ms, buffer_percent, sample_index) from every timestamp metadata
+    record; sample_index is the number of samples before it in as_array()."""
 
     end_of_acquisition: bool = False
     overcurrent: bool = False
 
     raw_lines: List[str] = field(default_factory=list)
-    """Every decoded text line, for the console log."""
+    """Every non-empty decoded text line, in stream order."""
+
+    def as_array(self) -> np.ndarray:
+        """Return every sample as a single float64 array."""
+        if not self.samples:
+            return np.empty(0, dtype=np.float64)
+        if len(self.samples) == 1:
+            return self.samples[0]          # already one array – no copy
+        return np.concatenate(self.samples)
+
+    def sample_count(self) -> int:
+        """Return the number of samples held, without concatenating them."""
+        return sum(len(chunk) for chunk in self.samples)
+
+    def extend(self, other: ParsedData) -> None:
+        """Append everything parsed in `other` after this result's content."""
+        if other.timestamps:
+            n = self.sample_count()
+            self.timestamps.extend(
+                (t, pct, n + i) for t, pct, i in other.timestamps
+            )
+        self.samples.extend(other.samples)
+        self.ack_lines.extend(other.ack_lines)
+        self.errors.extend(other.errors)
+        self.end_of_acquisition = self.end_of_acquisition or other.end_of_acquisition
+        self.overcurrent = self.overcurrent or other.overcurrent
+        self.raw_lines.extend(other.raw_lines)
 
 
 # ---------------------------------------------------------------------------
@@ -61,82 +149,138 @@ class AsciiParser:
 
     def __init__(self) -> None:
         self._buf = ""
+        self._line_samples: List[float] = []
 
     def reset(self) -> None:
         self._buf = ""
+        self._line_samples = []
 
     def feed(self, text: str) -> ParsedData:
         result = ParsedData()
-        self._buf += text
+        buf = self._buf + text
+        end = buf.rfind("\n") + 1
+        self._buf = buf[end:]          # trailing partial line
+        if not end:
+            return result
+
+        complete = buf[:end]
+        decode_run = self._decode_run
+        start = 0
+
+        # Runs of well-formed samples are decoded in one NumPy pass; the
+        # lines between them go through the line-by-line path.
+        for run in _SAMPLE_RUN.finditer(complete):
+            if run.start() > start:
+                self._dispatch_lines(complete[start:run.start()], result)
+            records = run.group()
+            result.raw_lines.extend(records[:-2].split("\r\n"))
+            decode_run(records, result)
+            start = run.end()
+        if start < end:
+            self._dispatch_lines(complete[start:], result)
+        return result
 
-        while "\n" in self._buf:
-            line, self._buf = self._buf.split("\n", 1)
+    def _dispatch_lines(self, block: str, result: ParsedData) -> None:
+        """Log and dispatch every line of a block of complete lines."""
+        raw_append = result.raw_lines.append
+        dispatch = self._dispatch
+        for line in block.split("\n"):
             line = line.rstrip("\r")
-            if not line:
-                continue
-            result.raw_lines.append(line)
-            self._dispatch(line, result)
-
-        return result
+            if line:
+                raw_append(line)
+                dispatch(line, result)
+        # Samples parsed line by line become one chunk per block.
+        if self._line_samples:
+            result.samples.append(np.array(self._line_samples))
+            self._line_samples = []
 
     # ------------------------------------------------------------------
     def _dispatch(self, line: str, result: ParsedData) -> None:
-        ch = line[0]
-
-        if ch.isdigit():
-            # Measurement sample
-            val = self._parse_sample(line)
-            if val is not None:
-                result.samples.append(val)
-
-        elif line.startswith("ack "):
+        handler = self._HANDLERS.get(line[0])
+        if handler is None:
+            handler = AsciiParser._on_sample if line[0].isdigit() else AsciiParser._on_other
+        handler(self, line, result)
+
+    def _on_sample(self, line: str, result: ParsedData) -> None:
+        val = self._parse_sample(line)
+        if val is not None:
+            self._line_samples.append(val)
+
+    def _on_a(self, line: str, result: ParsedData) -> None:
+        if line.startswith("ack "):
             parts = line[4:].strip().split(None, 1)
             cmd = parts[0] if parts else ""
             data = parts[1] if len(parts) > 1 else ""
             result.ack_lines.append((True, cmd, data))
+        else:
+            self._on_other(line, result)
 
-        elif line.startswith("err "):
+    def _on_e(self, line: str, result: ParsedData) -> None:
+        if line.startswith("err "):
             result.ack_lines.append((False, line[4:].strip(), ""))
-
         elif line == "end":
             result.end_of_acquisition = True
-
         elif line.startswith("error"):
             result.errors.append(line[5:].strip())
+        else:
+            self._on_other(line, result)
 
-        elif "Timestamp" in line or "timestamp" in line:
+    def _on_other(self, line: str, result: ParsedData) -> None:
+        if "Timestamp" in line or "timestamp" in line:
             ts = self._parse_timestamp(line)
             if ts:
-                result.timestamps.append(ts)
-
+                idx = result.sample_count() + len(self._line_samples)
+                result.timestamps.append((*ts, idx))
         # summary begin / summary end / pwr on / pwr off → ignore silently
 
+    # Handler per leading character; anything else is a Unicode digit
+    # (sample) or goes to _on_other.
+    _HANDLERS = {"a": _on_a, "e": _on_e}
+    _HANDLERS.update(dict.fromkeys("0123456789", _on_sample))
+
     # ------------------------------------------------------------------
+    @staticmethod
+    def _decode_run(run: str, result: ParsedData) -> None:
+        """Decode a block of fixed-width 'DDDDSZZ\\r\\n' records."""
+        rec = np.frombuffer(run.encode("ascii"), dtype=np.uint8)
+        if _decode_ascii is not None:
+            out = np.empty(len(rec) // 9, dtype=np.float64)
+            _decode_ascii(rec, out, _POW10_ARR)
+            result.samples.append(out)
+            return
+
+        d = rec.reshape(-1, 9)
+        d = d.astype(np.int32) - 48
+        mantissa = d[:, 0] * 1000 + d[:, 1] * 100 + d[:, 2] * 10 + d[:, 3]
+        exponent = d[:, 5] * 10 + d[:, 6]
+        exponent[d[:, 4] == 0x2D - 48] *= -1     # '-'
+        result.samples.append(mantissa * _POW10_ARR[exponent + 99])
+
     @staticmethod
     def _parse_sample(line: str) -> Optional[float]:
         """Parse 'DDDDSZZ' → float in Amperes."""
-        try:
-            if len(line) < 7:
-                return None
-            mantissa = int(line[0:4])
-            sign = -1 if line[4] == "-" else 1
-            exponent = int(line[5:7])
-            return mantissa * (10.0 ** (sign * exponent))
-        except (ValueError, IndexError):
+        # Non-ASCII characters become '?' and fail the digit checks below.
+        b = line.encode("ascii", errors="replace")
+        if len(b) < 7 or not (b[0:4].isdigit() and b[5:7].isdigit()):
             return None
+        mantissa = (b[0] - 48) * 1000 + (b[1] - 48) * 100 + (b[2] - 48) * 10 + (b[3] - 48)
+        exponent = (b[5] - 48) * 10 + (b[6] - 48)
+        if b[4] == 0x2D:   # '-'
+            exponent = -exponent
+        return mantissa * _POW10[exponent + 99]
 
     @staticmethod
     def _parse_timestamp(line: str) -> Optional[Tuple[int, int]]:
         """Return (time_ms, buffer_pct) from a Timestamp metadata line."""
         try:
             time_ms = 0
-            sec_m = re.search(r"(\d+)\s*s\b", line)
-            ms_m = re.search(r"(\d+)\s*ms", line)
+            sec_m = _TS_SEC.search(line)
+            ms_m = _TS_MS.search(line)
             if sec_m:
                 time_ms += int(sec_m.group(1)) * 1000
             if ms_m:
                 time_ms += int(ms_m.group(1))
-            buf_m = re.search(r"(\d+)\s*%", line)
+            buf_m = _TS_BUF.search(line)
             buf_pct = int(buf_m.group(1)) if buf_m else 0
             return (time_ms, buf_pct)
         except Exception:
@@ -180,39 +324,68 @@ class BinaryParser:
 
     def feed(self, data: bytes) -> ParsedData:
         result = ParsedData()
-        self._buf.extend(data)
+        buf = self._buf
+        buf.extend(data)
+        end = len(buf)
+        decode_samples = self._decode_samples
+        parse_meta = self._parse_meta
         pos = 0
 
-        while pos + 1 < len(self._buf):
-            b1 = self._buf[pos]
-            b2 = self._buf[pos + 1]
+        while pos + 1 < end:
+            # Decode the run of regular samples in one vectorised pass; it
+            # stops at the first lead byte of the form 0xFx.
+            pos = decode_samples(pos, result)
+            if pos + 1 >= end:
+                break
+
+            b1 = buf[pos]
+            b2 = buf[pos + 1]
 
             # Metadata: 0xF0 followed by 0xFx
             if b1 == 0xF0 and (b2 & 0xF0) == 0xF0:
-                new_pos = self._parse_meta(pos, b2, result)
+                new_pos = parse_meta(pos, b2, result)
                 if new_pos == pos:
                     break  # Not enough data yet; wait for more
                 pos = new_pos
                 continue
 
-            # Skip any stray 0xF0 (shouldn't appear alone)
-            if (b1 >> 4) == 0x0F:
-                pos += 1
-                continue
-
-            # Regular 2-byte measurement sample
-            neg_pow = (b1 >> 4) & 0x0F
-            value_int = ((b1 & 0x0F) << 8) | b2
-            if neg_pow > 0:
-                current = value_int / (16.0 ** neg_pow)
-            else:
-                current = float(value_int)
-            result.samples.append(current)
-            pos += 2
+            # Skip any stray 0xFx (shouldn't appear alone)
+            pos += 1
 
-        self._buf = self._buf[pos:]
+        if pos:
+            del buf[:pos]
         return result
 
+    # ------------------------------------------------------------------
+    def _decode_samples(self, start: int, result: ParsedData) -> int:
+        """Decode regular samples from `start`; return the first unconsumed index."""
+        n_pairs = (len(self._buf) - start) // 2
+        if n_pairs == 0:
+            return start
+
+        # The views must not outlive this call: a live export would stop
+        # the bytearray from being resized.
+        if _decode_bin is not None:
+            out = np.empty(n_pairs, dtype=np.float64)
+            n, pos = _decode_bin(
+                np.frombuffer(self._buf, dtype=np.uint8), start, out, _POW16_INV,
+            )
+            if n:
+                result.samples.append(out[:n])
+            return pos
+
+        pairs = np.frombuffer(
+            self._buf, dtype=np.uint8, count=n_pairs * 2, offset=start,
+        ).reshape(-1, 2)
+        b1 = pairs[:, 0]
+        meta = b1 >= 0xF0
+        n = int(meta.argmax()) if meta.any() else n_pairs
+        if n:
+            b1 = b1[:n]
+            value = ((b1 & 0x0F).astype(np.uint16) << 8) | pairs[:n, 1]
+            result.samples.append(value * _POW16_INV[b1 >> 4])
+        return start + 2 * n
+
     # ------------------------------------------------------------------
     def _parse_meta(self, start: int, meta_type: int, result: ParsedData) -> int:
         """Return new buffer position, or `start` if not enough data."""
@@ -221,17 +394,17 @@ class BinaryParser:
 
         if meta_type in (0xF1, 0xF2):
             # Variable-length ASCII until 0xFF 0xFF
-            for j in range(i, len(buf) - 1):
-                if buf[j] == 0xFF and buf[j + 1] == 0xFF:
-                    msg = buf[i:j].decode("ascii", errors="replace").strip()
-                    if meta_type == 0xF1:
-                        result.errors.append(msg)
-                    return j + 2
-            return start  # incomplete
+            j = buf.find(b"\xff\xff", i)
+            if j < 0:
+                return start  # incomplete
+            msg = buf[i:j].decode("ascii", errors="replace").strip()
+            if meta_type == 0xF1:
+                result.errors.append(msg)
+            return j + 2
 
         if meta_type == 0xF3:
             # 0xF0 0xF3 [4B ms] [1B buf%] 0xFF 0xFF  →  9 bytes total
-            if i + 6 > len(buf):
+            if i + 7 > len(buf):
                 return start
             time_ms = (
                 (buf[i] << 24) | (buf[i + 1] << 16) |
@@ -239,7 +412,7 @@ class BinaryParser:
             ) & 0x7FFF_FFFF  # clear overflow bit
             buf_pct = buf[i + 4]
             if buf[i + 5] == 0xFF and buf[i + 6] == 0xFF:
-                result.timestamps.append((time_ms, buf_pct))
+                result.timestamps.append((time_ms, buf_pct, result.sample_count()))
                 return i + 7
             return start
 
@@ -180,3 +180,16 @@ class Commands:
     def calib(cls) -> bytes:
         """Perform board self-calibration."""
         return cls._enc("calib")
+
+
+# Fixed commands, built once at import
+CMD_POWERSHIELD = Commands.powershield()
+CMD_VERSION     = Commands.version()
+CMD_HTC         = Commands.htc()
+CMD_HRC         = Commands.hrc()
+CMD_PSRST       = Commands.psrst()
+CMD_START       = Commands.start()
+CMD_STOP        = Commands.stop()
+CMD_TEMP        = Commands.temp()
+CMD_AUTOTEST    = Commands.autotest()
+CMD_CALIB       = Commands.calib()
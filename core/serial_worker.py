@@ -20,8 +20,12 @@ from __future__ import annotations
 
 import array
 import fcntl
+import os
+import selectors
 import struct
 import sys
+import time
+from collections import deque
 from typing import Optional
 
 import serial
@@ -70,6 +74,11 @@ def _set_custom_baudrate(fd: int, baudrate: int) -> None:
     fcntl.ioctl(fd, _TCSETS2, buf)
 
 
+# Readiness backend for the port fd and the wake-up pipe.  epoll handles
+# ttys on Linux; kqueue/poll do not on macOS, so fall back to select().
+_Selector = getattr(selectors, "EpollSelector", selectors.SelectSelector)
+
+
 def _open_port(port: str, baudrate: int) -> serial.Serial:
     """
     Open a serial port, handling non-standard baud rates on Linux.
@@ -106,6 +115,9 @@ class SerialWorker(QThread):
     """Handles all serial I/O asynchronously."""
 
     BAUD_RATE = 3_686_400
+    _RX_CHUNK = 65536                      # max bytes taken per read
+    _IDLE_WAIT = 0.1                       # max seconds blocked in select()
+    _EMIT_INTERVAL = 0.033                 # min seconds between data_ready
 
     # ── Signals ───────────────────────────────────────────────────────────────
     conn_changed = pyqtSignal(bool, str)   # (connected, message)
@@ -119,6 +131,9 @@ class SerialWorker(QThread):
         self._serial: Optional[serial.Serial] = None
         self._lock = QMutex()
 
+        # Single-reference fields below are read by run() without the lock;
+        # attribute loads and stores are atomic under the GIL.  The lock
+        # guards the command queue and multi-field updates.
         self._keep_running = False
         self._state = "idle"           # idle | ready | acquiring
         self._data_format = "ascii_dec"
@@ -126,14 +141,25 @@ class SerialWorker(QThread):
         self._ascii_parser = AsciiParser()
         self._binary_parser = BinaryParser()
 
-        # Command queue: list of (bytes_to_send, human_name)
-        self._cmd_queue: list[tuple[bytes, str]] = []
+        # Command queue: FIFO of (bytes_to_send, human_name)
+        self._cmd_queue: deque[tuple[bytes, str]] = deque()
 
         # During 'ready': buffer incoming text until we see ack/err
         self._resp_buf = ""
 
-        # Pending response – set when a command is in-flight
-        self._pending_cmd_name = ""
+        # Acquisition results not yet emitted, and when they are due
+        self._batch: Optional[ParsedData] = None
+        self._batch_due = 0.0
+
+        # Receive buffer reused by every read; handlers get a view of it
+        self._rx_buf = bytearray(self._RX_CHUNK)
+        self._rx_view = memoryview(self._rx_buf)
+
+        # Self-pipe used to wake the worker out of select() when a command
+        # is queued or a disconnect is requested; open only while run() is.
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._watched_fd = -1
+        self._wake_r = self._wake_w = -1
 
     # ── Public API (called from GUI thread) ───────────────────────────────────
 
@@ -163,16 +189,19 @@ class SerialWorker(QThread):
     def disconnect_device(self) -> None:
         with QMutexLocker(self._lock):
             self._keep_running = False
+        self._wake()
         self.wait(3000)
 
     def request_disconnect(self) -> None:
         """Signal the worker to stop without blocking the caller."""
         with QMutexLocker(self._lock):
             self._keep_running = False
+        self._wake()
 
     def send_command(self, cmd_bytes: bytes, cmd_name: str = "") -> None:
         with QMutexLocker(self._lock):
             self._cmd_queue.append((cmd_bytes, cmd_name))
+        self._wake()
 
     def set_data_format(self, fmt: str) -> None:
         with QMutexLocker(self._lock):
@@ -181,82 +210,152 @@ class SerialWorker(QThread):
     # ── Thread main loop ──────────────────────────────────────────────────────
 
     def run(self) -> None:
-        while True:
-            with QMutexLocker(self._lock):
-                if not self._keep_running:
-                    break
+        # The wake-up pipe and the selector live as long as this loop, so a
+        # finished worker holds no descriptors.
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        with QMutexLocker(self._lock):
+            self._wake_r, self._wake_w = wake_r, wake_w
+        try:
+            while self._keep_running:
                 ser = self._serial
                 state = self._state
                 fmt = self._data_format
 
-            if ser is None:
-                self.msleep(10)
-                continue
-
-            # ── Send queued commands ──────────────────────────────────────
-            if state in ("ready", "acquiring"):
-                with QMutexLocker(self._lock):
-                    if self._cmd_queue:
-                        cmd_bytes, cmd_name = self._cmd_queue.pop(0)
-                    else:
-                        cmd_bytes, cmd_name = b"", ""
-
-                if cmd_bytes:
-                    try:
-                        ser.write(cmd_bytes)
-                        ser.flush()
-                        display = cmd_bytes.decode("ascii", errors="replace").strip()
-                        self.log_message.emit(f">> {display}")
-                        with QMutexLocker(self._lock):
-                            self._pending_cmd_name = cmd_name
-                    except (serial.SerialException, OSError) as exc:
-                        self.log_message.emit(f"[Send error] {exc}")
-
-            # ── Read available data ───────────────────────────────────────
-            try:
-                waiting = ser.in_waiting
-                if waiting == 0:
-                    self.msleep(1)
+                if ser is None:
+                    self.msleep(10)
                     continue
-                raw = ser.read(min(waiting, 65536))
-            except (serial.SerialException, OSError) as exc:
-                self.log_message.emit(f"[Read error] {exc}")
-                break
 
-            if not raw:
-                self.msleep(1)
-                continue
+                # ── Send queued commands (one write for the whole burst) ──
+                if self._cmd_queue and state in ("ready", "acquiring"):
+                    with QMutexLocker(self._lock):
+                        queued = list(self._cmd_queue)
+                        self._cmd_queue.clear()
+
+                    if queued:
+                        try:
+                            ser.write(b"".join(cmd_bytes for cmd_bytes, _ in queued))
+                            ser.flush()
+                            for cmd_bytes, _ in queued:
+                                display = cmd_bytes.decode("ascii", errors="replace").strip()
+                                self.log_message.emit(f">> {display}")
+                        except (serial.SerialException, OSError) as exc:
+                            self.log_message.emit(f"[Send error] {exc}")
+
+                # ── Read available data (blocks until data, wake-up or timeout)
+                wait = self._IDLE_WAIT
+                if self._batch is not None:
+                    wait = max(0.0, self._batch_due - time.monotonic())
+                try:
+                    n = self._read_into_buffer(ser, wait)
+                except (serial.SerialException, OSError) as exc:
+                    self.log_message.emit(f"[Read error] {exc}")
+                    break
 
+                if not n:
+                    if self._batch is not None and time.monotonic() >= self._batch_due:
+                        self._flush_data()
+                    continue
+                raw = self._rx_view[:n]
+
+                if state == "ready":
+                    self._handle_command_response(raw)
+                elif state == "acquiring":
+                    self._handle_acquisition_data(raw, fmt)
+        finally:
+            # Cleanup
+            self._flush_data()
+            self._close_wait_fds()
             with QMutexLocker(self._lock):
-                state = self._state
-                fmt = self._data_format
+                ser = self._serial
+                self._serial = None
+                self._state = "idle"
+            if ser and ser.is_open:
+                try:
+                    ser.close()
+                except Exception:
+                    pass
+            self.conn_changed.emit(False, "Disconnected")
 
-            if state == "ready":
-                self._handle_command_response(raw)
-            elif state == "acquiring":
-                self._handle_acquisition_data(raw, fmt)
+    # ── Internal helpers ──────────────────────────────────────────────────────
 
-        # Cleanup
+    def _wake(self) -> None:
+        """Interrupt a pending select() in the worker thread."""
+        # Under the lock, so run() cannot close the pipe mid-write
         with QMutexLocker(self._lock):
-            ser = self._serial
-            self._serial = None
-            self._state = "idle"
-        if ser and ser.is_open:
+            if self._wake_w < 0:
+                return      # not running; run() checks its state on start
             try:
-                ser.close()
-            except Exception:
-                pass
-        self.conn_changed.emit(False, "Disconnected")
-
-    # ── Internal helpers ──────────────────────────────────────────────────────
+                os.write(self._wake_w, b"\0")
+            except BlockingIOError:
+                pass    # pipe already full – the worker is awake anyway
+
+    def _close_wait_fds(self) -> None:
+        """Close the selector and the wake-up pipe when run() ends."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+            self._watched_fd = -1
+        with QMutexLocker(self._lock):
+            wake_r, wake_w = self._wake_r, self._wake_w
+            self._wake_r = self._wake_w = -1
+        os.close(wake_r)
+        os.close(wake_w)
+
+    def _read_into_buffer(self, ser: serial.Serial, wait: float) -> int:
+        """Wait up to `wait` s for data or a wake-up and read into the receive buffer.
+
+        Returns the number of bytes read; 0 after a wake-up or timeout.
+        """
+        # Sleep in the kernel until bytes arrive or another thread wakes
+        # us, then take everything that is available in a single read.
+        fd = ser.fileno()
+        if fd != self._watched_fd:
+            if self._selector is not None:
+                self._selector.close()
+            self._selector = _Selector()
+            self._selector.register(fd, selectors.EVENT_READ)
+            self._selector.register(self._wake_r, selectors.EVENT_READ)
+            self._watched_fd = fd
+
+        readable = False
+        for key, _ in self._selector.select(wait):
+            if key.fd == fd:
+                readable = True
+            else:
+                try:
+                    while os.read(self._wake_r, 256):
+                        pass
+                except BlockingIOError:
+                    pass
+        if not readable:
+            return 0
+        # os.readv fills the receive buffer straight from the fd; pyserial's
+        # readinto() goes through read() and allocates a bytes object.
+        try:
+            n = os.readv(fd, [self._rx_view])
+        except BlockingIOError:
+            return 0
+        if n == 0:
+            # Same condition pyserial reports for an unplugged device
+            raise serial.SerialException(
+                "device reports readiness to read but returned no data"
+            )
+        return n
 
     # Device prepends "PowerShield > " to every response line.
     _PROMPT = "PowerShield > "
 
-    def _handle_command_response(self, raw: bytes) -> None:
+    def _handle_command_response(self, raw: memoryview) -> None:
         """Parse incoming bytes as ASCII command responses."""
-        text = raw.decode("ascii", errors="replace")
-        self._resp_buf += text
+        buf = self._resp_buf + str(raw, "ascii", errors="replace")
+
+        # Strip the interactive shell prompt from all complete lines in one
+        # pass.  The trailing partial line is left alone: it may end with
+        # only half of the prompt.
+        nl = buf.rfind("\n") + 1
+        self._resp_buf = buf[:nl].replace(self._PROMPT, "") + buf[nl:]
 
         while "\n" in self._resp_buf:
             line, self._resp_buf = self._resp_buf.split("\n", 1)
@@ -265,11 +364,8 @@ class SerialWorker(QThread):
                 continue
             self.log_message.emit(f"<< {line}")
 
-            # Strip the interactive shell prompt before parsing
-            cmd_line = line[len(self._PROMPT):] if line.startswith(self._PROMPT) else line
-
-            if cmd_line.startswith("ack "):
-                parts = cmd_line[4:].strip().split(None, 1)
+            if line.startswith("ack "):
+                parts = line[4:].strip().split(None, 1)
                 cmd = parts[0].rstrip(":") if parts else ""
                 payload = parts[1] if len(parts) > 1 else ""
                 self.cmd_result.emit(True, cmd, payload)
@@ -292,26 +388,42 @@ class SerialWorker(QThread):
                         else:
                             # Binary leftover has been corrupted by the ASCII
                             # decoder — discard it.  Clean binary frames will
-                            # arrive in the next ser.read() call.
+                            # arrive with the next read.
                             self._resp_buf = ""
                     return
 
-            elif cmd_line.startswith("err "):
+            elif line.startswith("err "):
                 # Manual documents 'err' prefix; handle for completeness
-                payload = cmd_line[4:].strip()
+                payload = line[4:].strip()
                 self.cmd_result.emit(False, "", payload)
 
-            elif cmd_line.startswith("error "):
+            elif line.startswith("error "):
                 # Firmware actually uses 'error <cmd> [<args>]' for failures
-                parts = cmd_line[6:].strip().split(None, 1)
+                parts = line[6:].strip().split(None, 1)
                 cmd = parts[0] if parts else ""
                 payload = parts[1] if len(parts) > 1 else ""
                 self.cmd_result.emit(False, cmd, payload)
 
-    def _handle_acquisition_data(self, raw: bytes, fmt: str) -> None:
+    def _queue_data(self, result: ParsedData) -> None:
+        """Batch results so data_ready fires at most every _EMIT_INTERVAL."""
+        if self._batch is None:
+            self._batch = result
+            self._batch_due = time.monotonic() + self._EMIT_INTERVAL
+        else:
+            self._batch.extend(result)
+        if (result.end_of_acquisition or result.overcurrent
+                or time.monotonic() >= self._batch_due):
+            self._flush_data()
+
+    def _flush_data(self) -> None:
+        if self._batch is not None:
+            batch, self._batch = self._batch, None
+            self.data_ready.emit(batch)
+
+    def _handle_acquisition_data(self, raw: bytes | memoryview, fmt: str) -> None:
         """Route raw bytes through the appropriate measurement parser."""
         if fmt == "ascii_dec":
-            text = raw.decode("ascii", errors="replace")
+            text = str(raw, "ascii", errors="replace")
             result: ParsedData = self._ascii_parser.feed(text)
         else:
             result = self._binary_parser.feed(raw)
@@ -323,10 +435,10 @@ class SerialWorker(QThread):
         for err in result.errors:
             self.log_message.emit(f"[Stream error] {err}")
 
-        # Emit parsed data to UI
+        # Queue parsed data for the UI
         if (result.samples or result.timestamps or
                 result.errors or result.end_of_acquisition or result.overcurrent):
-            self.data_ready.emit(result)
+            self._queue_data(result)
 
         # Handle embedded command acks (e.g. 'ack stop' in ASCII stream)
         for success, cmd, payload in result.ack_lines:
@@ -8,7 +8,7 @@ data format, trigger, current threshold, and power settings.
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QCheckBox, QComboBox, QDoubleSpinBox, QFormLayout,
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QSlider,
@@ -18,6 +18,15 @@ from PyQt5.QtWidgets import (
 from core.protocol import Commands
 
 
+def _make_combo() -> QComboBox:
+    """Read-only combo sized from a fixed character count, not its items."""
+    combo = QComboBox()
+    combo.setInsertPolicy(QComboBox.NoInsert)
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(22)
+    return combo
+
+
 class ConfigPanel(QGroupBox):
     """All acquisition configuration widgets."""
 
@@ -25,6 +34,10 @@ class ConfigPanel(QGroupBox):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Configuration", parent)
+        self._bulk_enabled: bool | None = None   # last set_enabled_controls()
+        # Widget values and the command list last built from them
+        self._cfg_state: tuple | None = None
+        self._cfg_cmds: list[tuple[bytes, str]] = []
         self._build_ui()
 
     # ── Build ─────────────────────────────────────────────────────────────────
@@ -40,18 +53,16 @@ class ConfigPanel(QGroupBox):
         form.setContentsMargins(0, 0, 0, 0)
 
         # ── Voltage ──────────────────────────────────────────────────────────
-        volt_row = QHBoxLayout()
         self.volt_spin = QSpinBox()
         self.volt_spin.setRange(1800, 3300)
         self.volt_spin.setSingleStep(100)
         self.volt_spin.setValue(3300)
         self.volt_spin.setSuffix(" mV")
         self.volt_spin.setToolTip("Target power supply voltage (1800–3300 mV)")
-        volt_row.addWidget(self.volt_spin)
-        form.addRow("Voltage:", volt_row)
+        form.addRow("Voltage:", self.volt_spin)
 
         # ── Sampling frequency ────────────────────────────────────────────────
-        self.freq_combo = QComboBox()
+        self.freq_combo = _make_combo()
         for hz, label in Commands.FREQ_OPTIONS:
             self.freq_combo.addItem(label, hz)
         # Default 100 Hz
@@ -80,7 +91,7 @@ class ConfigPanel(QGroupBox):
         form.addRow("Acq. time:", acqtime_row)
 
         # ── Acquisition mode ──────────────────────────────────────────────────
-        self.acqmode_combo = QComboBox()
+        self.acqmode_combo = _make_combo()
         self.acqmode_combo.addItem("Dynamic (100 nA–10 mA)", "dyn")
         self.acqmode_combo.addItem("Static  (2 nA–200 mA)",  "stat")
         self.acqmode_combo.setToolTip(
@@ -89,7 +100,7 @@ class ConfigPanel(QGroupBox):
         form.addRow("Acq. mode:", self.acqmode_combo)
 
         # ── Function mode ─────────────────────────────────────────────────────
-        self.funcmode_combo = QComboBox()
+        self.funcmode_combo = _make_combo()
         self.funcmode_combo.addItem("Optimised (100 nA–10 mA, ≤100 kHz)", "optim")
         self.funcmode_combo.addItem("High current (30 µA–10 mA, 50–100 kHz)", "high")
         self.funcmode_combo.setToolTip(
@@ -99,7 +110,7 @@ class ConfigPanel(QGroupBox):
         form.addRow("Func. mode:", self.funcmode_combo)
 
         # ── Output type ───────────────────────────────────────────────────────
-        self.output_combo = QComboBox()
+        self.output_combo = _make_combo()
         self.output_combo.addItem("Current (instantaneous)", "current")
         self.output_combo.addItem("Energy  (integrated)", "energy")
         self.output_combo.setToolTip(
@@ -109,7 +120,7 @@ class ConfigPanel(QGroupBox):
         form.addRow("Output:", self.output_combo)
 
         # ── Data format ───────────────────────────────────────────────────────
-        self.format_combo = QComboBox()
+        self.format_combo = _make_combo()
         self.format_combo.addItem("ASCII decimal  (≤10 kHz)", "ascii_dec")
         self.format_combo.addItem("Binary hex     (≤100 kHz)", "bin_hexa")
         self.format_combo.setToolTip(
@@ -119,7 +130,7 @@ class ConfigPanel(QGroupBox):
         form.addRow("Format:", self.format_combo)
 
         # ── Trigger source ────────────────────────────────────────────────────
-        self.trigsrc_combo = QComboBox()
+        self.trigsrc_combo = _make_combo()
         self.trigsrc_combo.addItem("Software (immediate)", "sw")
         self.trigsrc_combo.addItem("External D7 pin", "d7")
         form.addRow("Trigger:", self.trigsrc_combo)
@@ -149,22 +160,20 @@ class ConfigPanel(QGroupBox):
         self.currthre_spin.setToolTip(
             "Current threshold for D2/D3 signal and LED4 event (0–10 mA)"
         )
-        self.currthre_enable.stateChanged.connect(
-            lambda s: self.currthre_spin.setEnabled(s == Qt.Checked)
-        )
+        self.currthre_enable.stateChanged.connect(self._on_currthre_toggled)
         currthre_row.addWidget(self.currthre_enable)
         currthre_row.addWidget(self.currthre_spin)
         form.addRow("Curr. thre.:", currthre_row)
 
         # ── Power supply ──────────────────────────────────────────────────────
-        self.pwr_combo = QComboBox()
+        self.pwr_combo = _make_combo()
         self.pwr_combo.addItem("Auto (on at start, follows pwrend)", "auto")
         self.pwr_combo.addItem("Force ON", "on")
         self.pwr_combo.addItem("Force OFF", "off")
         form.addRow("Power:", self.pwr_combo)
 
         # ── Power after acquisition ───────────────────────────────────────────
-        self.pwrend_combo = QComboBox()
+        self.pwrend_combo = _make_combo()
         self.pwrend_combo.addItem("Keep ON", "on")
         self.pwrend_combo.addItem("Turn OFF", "off")
         form.addRow("Power end:", self.pwrend_combo)
@@ -178,20 +187,38 @@ class ConfigPanel(QGroupBox):
         self.apply_btn.setEnabled(False)
         root.addWidget(self.apply_btn)
 
+        # Widgets toggled together by set_enabled_controls()
+        self._bulk_widgets = (
+            self.volt_spin, self.freq_combo, self.acqtime_spin,
+            self.inf_check, self.acqmode_combo, self.funcmode_combo,
+            self.output_combo, self.format_combo, self.trigsrc_combo,
+            self.trigdelay_spin, self.currthre_enable,
+            self.pwr_combo, self.pwrend_combo, self.apply_btn,
+        )
+
     # ── Slots ─────────────────────────────────────────────────────────────────
 
+    @pyqtSlot(int)
     def _on_inf_changed(self, state: int) -> None:
         self.acqtime_spin.setEnabled(state == Qt.Unchecked)
 
+    @pyqtSlot(int)
+    def _on_currthre_toggled(self, state: int) -> None:
+        self.currthre_spin.setEnabled(state == Qt.Checked)
+
+    @pyqtSlot(int)
     def _on_freq_changed(self, _: int) -> None:
         """Warn when binary format is required for high frequencies."""
         hz = self.freq_combo.currentData()
         if hz is not None and hz > 10000:
             if self.format_combo.currentData() == "ascii_dec":
-                # Auto-switch to binary
+                # Auto-switch to binary without re-entering other slots
                 idx = self.format_combo.findData("bin_hexa")
+                self.format_combo.blockSignals(True)
                 self.format_combo.setCurrentIndex(idx)
+                self.format_combo.blockSignals(False)
 
+    @pyqtSlot()
     def _on_apply(self) -> None:
         self.apply_requested.emit(self.build_command_list())
 
@@ -199,13 +226,10 @@ class ConfigPanel(QGroupBox):
 
     def set_enabled_controls(self, enabled: bool) -> None:
         """Disable all controls while acquiring."""
-        for w in (
-            self.volt_spin, self.freq_combo, self.acqtime_spin,
-            self.inf_check, self.acqmode_combo, self.funcmode_combo,
-            self.output_combo, self.format_combo, self.trigsrc_combo,
-            self.trigdelay_spin, self.currthre_enable,
-            self.pwr_combo, self.pwrend_combo, self.apply_btn,
-        ):
+        if enabled == self._bulk_enabled:
+            return
+        self._bulk_enabled = enabled
+        for w in self._bulk_widgets:
             w.setEnabled(enabled)
         # Keep the spin enabled only when the checkbox is also enabled
         self.currthre_spin.setEnabled(
@@ -213,11 +237,8 @@ class ConfigPanel(QGroupBox):
         )
 
     def set_connected(self, connected: bool) -> None:
-        self.apply_btn.setEnabled(connected)
-        if not connected:
-            self.set_enabled_controls(False)
-        else:
-            self.set_enabled_controls(True)
+        # apply_btn is part of the bulk group
+        self.set_enabled_controls(connected)
 
     def get_data_format(self) -> str:
         return self.format_combo.currentData() or "ascii_dec"
@@ -227,6 +248,18 @@ class ConfigPanel(QGroupBox):
 
     def build_command_list(self) -> list[tuple[bytes, str]]:
         """Return ordered list of (cmd_bytes, name) for current settings."""
+        state = (
+            self.volt_spin.value(), self.freq_combo.currentData(),
+            self.inf_check.isChecked(), self.acqtime_spin.value(),
+            self.acqmode_combo.currentData(), self.funcmode_combo.currentData(),
+            self.output_combo.currentData(), self.format_combo.currentData(),
+            self.trigsrc_combo.currentData(), self.trigdelay_spin.value(),
+            self.currthre_enable.isChecked(), self.currthre_spin.value(),
+            self.pwr_combo.currentData(), self.pwrend_combo.currentData(),
+        )
+        if state == self._cfg_state:
+            return list(self._cfg_cmds)
+
         cmds: list[tuple[bytes, str]] = []
 
         cmds.append((Commands.volt(self.volt_spin.value()), "volt"))
@@ -248,4 +281,6 @@ class ConfigPanel(QGroupBox):
         cmds.append((Commands.pwr(self.pwr_combo.currentData()), "pwr"))
         cmds.append((Commands.pwrend(self.pwrend_combo.currentData()), "pwrend"))
 
-        return cmds
+        self._cfg_state = state
+        self._cfg_cmds = cmds
+        return list(cmds)
@@ -4,7 +4,7 @@ Connection panel – serial port selection, connect/disconnect, device info.
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QComboBox,
     QVBoxLayout, QWidget, QFrame,
@@ -22,6 +22,12 @@ class ConnectionPanel(QGroupBox):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Connection", parent)
+        self._last_ports: tuple[str, ...] = ()   # what port_combo lists
+        # Collapses bursts of refresh_ports() calls into one port scan
+        self._scan_timer = QTimer(self)
+        self._scan_timer.setSingleShot(True)
+        self._scan_timer.setInterval(250)
+        self._scan_timer.timeout.connect(self._do_refresh)
         self._build_ui()
 
     # ── UI construction ───────────────────────────────────────────────────────
@@ -36,6 +42,11 @@ class ConnectionPanel(QGroupBox):
         port_row.addWidget(QLabel("Port:"))
         self.port_combo = QComboBox()
         self.port_combo.setMinimumWidth(110)
+        self.port_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.port_combo.setSizeAdjustPolicy(
+            QComboBox.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.port_combo.setMinimumContentsLength(12)    # "/dev/ttyACM0"
         self.port_combo.setToolTip("Select the COM / ttyUSB port")
         port_row.addWidget(self.port_combo, 1)
         self.scan_btn = QPushButton("Scan")
@@ -72,7 +83,8 @@ class ConnectionPanel(QGroupBox):
         grid.setSpacing(4)
 
         self.status_lbl = self._info_row(grid, "Status:", "Not connected")
-        self.status_lbl.setObjectName("status_err")
+        self._status_name = "status_err"
+        self.status_lbl.setObjectName(self._status_name)
 
         self.board_id_lbl = self._info_row(grid, "Board ID:", "–")
         self.fw_ver_lbl = self._info_row(grid, "Firmware:", "–")
@@ -82,7 +94,7 @@ class ConnectionPanel(QGroupBox):
         root.addStretch()
 
         # Populate port list at start-up
-        self.refresh_ports()
+        self._do_refresh()
 
     def _info_row(self, layout: QVBoxLayout, label: str, value: str) -> QLabel:
         row = QHBoxLayout()
@@ -97,10 +109,12 @@ class ConnectionPanel(QGroupBox):
 
     # ── Slots ─────────────────────────────────────────────────────────────────
 
+    @pyqtSlot()
     def _on_scan(self) -> None:
         self.refresh_ports()
         self.scan_requested.emit()
 
+    @pyqtSlot()
     def _on_connect(self) -> None:
         port = self.port_combo.currentText()
         if port:
@@ -109,12 +123,23 @@ class ConnectionPanel(QGroupBox):
     # ── Public helpers ────────────────────────────────────────────────────────
 
     def refresh_ports(self) -> None:
+        """Rescan serial ports shortly; repeated calls share one scan."""
+        self._scan_timer.start()
+
+    @pyqtSlot()
+    def _do_refresh(self) -> None:
+        ports = tuple(SerialWorker.list_ports())
+        if ports == self._last_ports:
+            return      # nothing plugged or unplugged – keep the combo as is
+        self._last_ports = ports
+
         current = self.port_combo.currentText()
-        ports = SerialWorker.list_ports()
+        self.port_combo.blockSignals(True)
         self.port_combo.clear()
         self.port_combo.addItems(ports)
         if current in ports:
             self.port_combo.setCurrentText(current)
+        self.port_combo.blockSignals(False)
 
     def set_connected(self, connected: bool, message: str = "") -> None:
         self.connect_btn.setEnabled(not connected)
@@ -124,17 +149,19 @@ class ConnectionPanel(QGroupBox):
 
         if connected:
             self.status_lbl.setText("Connected")
-            self.status_lbl.setObjectName("status_ok")
         else:
             self.status_lbl.setText("Disconnected")
-            self.status_lbl.setObjectName("status_err")
             self.board_id_lbl.setText("–")
             self.fw_ver_lbl.setText("–")
             self.board_temp_lbl.setText("–")
 
-        # Force stylesheet re-evaluation (objectName change)
-        self.status_lbl.style().unpolish(self.status_lbl)
-        self.status_lbl.style().polish(self.status_lbl)
+        # Force stylesheet re-evaluation, but only if the objectName changed
+        name = "status_ok" if connected else "status_err"
+        if name != self._status_name:
+            self._status_name = name
+            self.status_lbl.setObjectName(name)
+            self.status_lbl.style().unpolish(self.status_lbl)
+            self.status_lbl.style().polish(self.status_lbl)
 
     def set_board_id(self, board_id: str) -> None:
         self.board_id_lbl.setText(board_id)
@@ -4,13 +4,15 @@ Console widget – scrollable log of all serial I/O plus a raw command input.
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections import deque
+from typing import Iterable
 
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QColor, QTextCharFormat, QTextCursor
 from PyQt5.QtWidgets import (
-    QHBoxLayout, QLineEdit, QPushButton,
-    QTextEdit, QVBoxLayout, QWidget,
+    QHBoxLayout, QLineEdit, QPlainTextEdit,
+    QPushButton, QVBoxLayout, QWidget,
 )
 
 
@@ -22,6 +24,9 @@ class ConsoleWidget(QWidget):
     # Maximum lines kept in the text box (old lines are trimmed automatically)
     MAX_LINES = 2000
 
+    # Lines are buffered and written to the document at most this often
+    _FLUSH_MS = 30
+
     # Colour map keyed on message prefix
     _COLORS = {
         ">>": "#5bc8d0",    # sent command (teal)
@@ -34,8 +39,21 @@ class ConsoleWidget(QWidget):
     }
     _DEFAULT_COLOR = "#9098b8"
 
+    # Longest prefix first, so "[W"/"[E" win over the generic "["
+    _COLOR_TABLE = tuple(sorted(_COLORS.items(), key=lambda kv: -len(kv[0])))
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
+        # (colour, line) not yet written; only the newest MAX_LINES could
+        # survive the document's own trimming, so older ones are dropped here
+        self._pending: deque[tuple[str, str]] = deque(maxlen=self.MAX_LINES)
+        # "HH:MM:SS" of the last logged second, reused for bursts of lines
+        self._ts_sec = -1
+        self._ts_hms = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self._FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush)
         self._build_ui()
 
     # ── Build ─────────────────────────────────────────────────────────────────
@@ -45,12 +63,25 @@ class ConsoleWidget(QWidget):
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(4)
 
-        self._log = QTextEdit()
+        self._log = QPlainTextEdit()
         self._log.setReadOnly(True)
-        self._log.setLineWrapMode(QTextEdit.NoWrap)
+        self._log.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Qt drops the oldest block itself once the limit is reached
+        self._log.setMaximumBlockCount(self.MAX_LINES)
         self._log.setMinimumHeight(80)
         root.addWidget(self._log, 1)
 
+        # Insertion cursor kept for the widget's lifetime; the document
+        # keeps it valid across trimming and clear().
+        self._cursor = QTextCursor(self._log.document())
+
+        # One character format per colour, shared by every inserted line
+        self._formats: dict[str, QTextCharFormat] = {}
+        for color in {*self._COLORS.values(), self._DEFAULT_COLOR}:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[color] = fmt
+
         # Input row
         input_row = QHBoxLayout()
         self._input = QLineEdit()
@@ -65,7 +96,7 @@ class ConsoleWidget(QWidget):
 
         clear_btn = QPushButton("Clear log")
         clear_btn.setFixedWidth(72)
-        clear_btn.clicked.connect(self._log.clear)
+        clear_btn.clicked.connect(self.clear)
         input_row.addWidget(clear_btn)
 
         root.addLayout(input_row)
@@ -74,40 +105,69 @@ class ConsoleWidget(QWidget):
 
     def append(self, text: str) -> None:
         """Append a line to the log with appropriate colour."""
-        if not text:
+        self.append_lines((text,))
+
+    def append_lines(self, texts: Iterable[str]) -> None:
+        """Append several lines at once; they share one timestamp."""
+        now = time.time()
+        sec = int(now)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_hms = time.strftime("%H:%M:%S", time.localtime(sec))
+        stamp = f"[{self._ts_hms}.{int((now - sec) * 1000):03d}]  "
+
+        queued = False
+        for text in texts:
+            if not text:
+                continue
+            # Pick colour
+            color = next(
+                (col for prefix, col in self._COLOR_TABLE if text.startswith(prefix)),
+                self._DEFAULT_COLOR,
+            )
+            self._pending.append((color, stamp + text))
+            queued = True
+
+        if queued and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def clear(self) -> None:
+        """Drop all logged and not yet displayed lines."""
+        self._pending.clear()
+        self._log.clear()
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    @pyqtSlot()
+    def _flush(self) -> None:
+        """Write buffered lines, one insert per run of same-coloured lines."""
+        if not self._pending:
             return
+        pending = list(self._pending)
+        self._pending.clear()
 
-        ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        full = f"[{ts}]  {text}"
-
-        # Pick colour
-        color = self._DEFAULT_COLOR
-        for prefix, col in self._COLORS.items():
-            if text.startswith(prefix):
-                color = col
-                break
-
-        # Append with colour
-        cursor = self._log.textCursor()
+        cursor = self._cursor
         cursor.movePosition(QTextCursor.End)
-        fmt = QTextCharFormat()
-        fmt.setForeground(QColor(color))
-        cursor.insertText(full + "\n", fmt)
-
-        # Trim old lines
-        doc = self._log.document()
-        while doc.lineCount() > self.MAX_LINES:
-            cursor = doc.find("\n")
-            tc = QTextCursor(doc)
-            tc.movePosition(QTextCursor.Start)
-            tc.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
-            tc.removeSelectedText()
-
-        self._log.setTextCursor(cursor)
-        self._log.ensureCursorVisible()
+        cursor.beginEditBlock()
+        i = 0
+        while i < len(pending):
+            color = pending[i][0]
+            j = i + 1
+            while j < len(pending) and pending[j][0] == color:
+                j += 1
+            cursor.insertText(
+                "".join(line + "\n" for _, line in pending[i:j]),
+                self._formats[color],
+            )
+            i = j
+        cursor.endEditBlock()
+
+        scroll = self._log.verticalScrollBar()
+        scroll.setValue(scroll.maximum())
 
     # ── Slots ─────────────────────────────────────────────────────────────────
 
+    @pyqtSlot()
     def _on_send(self) -> None:
         text = self._input.text().strip()
         if text:
@@ -4,9 +4,9 @@ Control panel – Start/Stop acquisition and device utility commands.
 
 from __future__ import annotations
 
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import (
-    QDoubleSpinBox, QFormLayout, QGroupBox, QHBoxLayout,
+    QDoubleSpinBox, QFormLayout, QGridLayout, QGroupBox, QHBoxLayout,
     QLabel, QPushButton, QVBoxLayout, QWidget,
 )
 
@@ -17,12 +17,16 @@ class ControlPanel(QGroupBox):
     start_requested = pyqtSignal()
     stop_requested = pyqtSignal()
     targrst_requested = pyqtSignal(int)   # duration in ms
-    temp_requested = pyqtSignal()
-    calib_requested = pyqtSignal()
-    autotest_requested = pyqtSignal()
-    htc_requested = pyqtSignal()
-    hrc_requested = pyqtSignal()
-    psrst_requested = pyqtSignal()
+    # htc | hrc | temp | calib | autotest | psrst
+    util_requested = pyqtSignal(str)
+
+    # Bit of each button in the enabled mask (index into _buttons)
+    _START, _STOP, _HTC, _HRC, _TEMP, _CALIB, _AUTOTEST, _PSRST, _TARGRST = (
+        1 << i for i in range(9)
+    )
+    _UTILS = _HTC | _HRC | _TEMP | _CALIB | _AUTOTEST | _PSRST | _TARGRST
+    # Buttons that could disrupt a running acquisition
+    _DISRUPTIVE = _HTC | _HRC | _CALIB | _AUTOTEST | _PSRST
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Controls", parent)
@@ -33,68 +37,61 @@ class ControlPanel(QGroupBox):
         root.setSpacing(8)
         root.setContentsMargins(10, 14, 10, 10)
 
+        # Two-column grid: one row per button pair
+        grid = QGridLayout()
+        grid.setSpacing(8)
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 1)
+
         # ── Start / Stop ──────────────────────────────────────────────────────
-        acq_row = QHBoxLayout()
         self.start_btn = QPushButton("▶  START")
         self.start_btn.setObjectName("start_btn")
         self.start_btn.setToolTip("Configure and start measurement acquisition")
         self.start_btn.setEnabled(False)
         self.start_btn.clicked.connect(self.start_requested)
-        acq_row.addWidget(self.start_btn)
+        grid.addWidget(self.start_btn, 0, 0)
 
         self.stop_btn = QPushButton("■  STOP")
         self.stop_btn.setObjectName("stop_btn")
         self.stop_btn.setToolTip("Stop the current acquisition")
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self.stop_requested)
-        acq_row.addWidget(self.stop_btn)
-        root.addLayout(acq_row)
+        grid.addWidget(self.stop_btn, 0, 1)
 
         # ── Host control ──────────────────────────────────────────────────────
-        htc_row = QHBoxLayout()
         self.htc_btn = QPushButton("Take Host Control")
         self.htc_btn.setToolTip("htc – switch from standalone to host mode")
         self.htc_btn.setEnabled(False)
-        self.htc_btn.clicked.connect(self.htc_requested)
-        htc_row.addWidget(self.htc_btn)
+        grid.addWidget(self.htc_btn, 1, 0)
 
         self.hrc_btn = QPushButton("Release Control")
         self.hrc_btn.setToolTip("hrc – return to standalone mode")
         self.hrc_btn.setEnabled(False)
-        self.hrc_btn.clicked.connect(self.hrc_requested)
-        htc_row.addWidget(self.hrc_btn)
-        root.addLayout(htc_row)
+        grid.addWidget(self.hrc_btn, 1, 1)
 
         # ── Utility buttons ───────────────────────────────────────────────────
-        util_row = QHBoxLayout()
         self.temp_btn = QPushButton("Temperature")
         self.temp_btn.setToolTip("Read board temperature (°C)")
         self.temp_btn.setEnabled(False)
-        self.temp_btn.clicked.connect(self.temp_requested)
-        util_row.addWidget(self.temp_btn)
+        grid.addWidget(self.temp_btn, 2, 0)
 
         self.calib_btn = QPushButton("Calibrate")
         self.calib_btn.setToolTip("Run self-calibration (do when temp shifts >5 °C)")
         self.calib_btn.setEnabled(False)
-        self.calib_btn.clicked.connect(self.calib_requested)
-        util_row.addWidget(self.calib_btn)
-        root.addLayout(util_row)
+        grid.addWidget(self.calib_btn, 2, 1)
 
-        util2_row = QHBoxLayout()
         self.autotest_btn = QPushButton("Auto-test")
         self.autotest_btn.setToolTip("Run board self-test")
         self.autotest_btn.setEnabled(False)
-        self.autotest_btn.clicked.connect(self.autotest_requested)
-        util2_row.addWidget(self.autotest_btn)
+        grid.addWidget(self.autotest_btn, 3, 0)
 
         self.psrst_btn = QPushButton("Board Reset")
         self.psrst_btn.setToolTip("psrst – hardware reset of PowerShield")
         self.psrst_btn.setEnabled(False)
-        self.psrst_btn.clicked.connect(self.psrst_requested)
-        util2_row.addWidget(self.psrst_btn)
-        root.addLayout(util2_row)
+        grid.addWidget(self.psrst_btn, 3, 1)
 
         # ── Target reset ──────────────────────────────────────────────────────
+        # The button fills the row beside a fixed-width duration spin box.
         trst_row = QHBoxLayout()
         self.targrst_btn = QPushButton("Target Reset")
         self.targrst_btn.setToolTip(
@@ -112,12 +109,35 @@ class ControlPanel(QGroupBox):
         self.targrst_spin.setFixedWidth(90)
         self.targrst_spin.setToolTip("Power-off duration for target reset")
         trst_row.addWidget(self.targrst_spin)
-        root.addLayout(trst_row)
+        grid.addLayout(trst_row, 4, 0, 1, 2)
 
+        root.addLayout(grid)
         root.addStretch()
 
+        # Utility buttons share one signal carrying the command name
+        for name, btn in (
+            ("htc", self.htc_btn), ("hrc", self.hrc_btn),
+            ("temp", self.temp_btn), ("calib", self.calib_btn),
+            ("autotest", self.autotest_btn), ("psrst", self.psrst_btn),
+        ):
+            btn.setProperty("util_cmd", name)
+            btn.clicked.connect(self._on_util)
+
+        # Same order as the bit constants; all start disabled
+        self._buttons = (
+            self.start_btn, self.stop_btn, self.htc_btn, self.hrc_btn,
+            self.temp_btn, self.calib_btn, self.autotest_btn,
+            self.psrst_btn, self.targrst_btn,
+        )
+        self._enabled_mask = 0
+
     # ── Slots ─────────────────────────────────────────────────────────────────
 
+    @pyqtSlot()
+    def _on_util(self) -> None:
+        self.util_requested.emit(self.sender().property("util_cmd"))
+
+    @pyqtSlot()
     def _on_targrst(self) -> None:
         ms = int(self.targrst_spin.value() * 1000)
         self.targrst_requested.emit(ms)
@@ -125,29 +145,33 @@ class ControlPanel(QGroupBox):
     # ── Public helpers ─────────────────────────────────────────────────────────
 
     def set_connected(self, connected: bool) -> None:
-        for btn in (
-            self.htc_btn, self.hrc_btn, self.temp_btn,
-            self.calib_btn, self.autotest_btn, self.psrst_btn,
-            self.targrst_btn,
-        ):
-            btn.setEnabled(connected)
-        if not connected:
-            self.start_btn.setEnabled(False)
-            self.stop_btn.setEnabled(False)
+        if connected:
+            self._set_enabled(self._enabled_mask | self._UTILS)
+        else:
+            self._set_enabled(0)
 
     def set_acquiring(self, acquiring: bool) -> None:
-        self.start_btn.setEnabled(not acquiring)
-        self.stop_btn.setEnabled(acquiring)
-        # During acquisition, disable other buttons that could disrupt it
-        for btn in (
-            self.htc_btn, self.hrc_btn, self.calib_btn,
-            self.autotest_btn, self.psrst_btn,
-        ):
-            btn.setEnabled(not acquiring)
+        mask = self._enabled_mask & ~(self._START | self._STOP | self._DISRUPTIVE)
+        if acquiring:
+            # During acquisition, disable other buttons that could disrupt it
+            mask |= self._STOP
+        else:
+            mask |= self._START | self._DISRUPTIVE
         # Target reset is allowed during acquisition (monitor power-up transient)
         # Temp is also safe during acquisition
-        self.targrst_btn.setEnabled(True)
-        self.temp_btn.setEnabled(True)
+        self._set_enabled(mask | self._TARGRST | self._TEMP)
 
     def enable_start(self, enabled: bool) -> None:
-        self.start_btn.setEnabled(enabled)
+        if enabled:
+            self._set_enabled(self._enabled_mask | self._START)
+        else:
+            self._set_enabled(self._enabled_mask & ~self._START)
+
+    def _set_enabled(self, mask: int) -> None:
+        """Enable exactly the buttons in `mask`, touching only those that change."""
+        diff = mask ^ self._enabled_mask
+        self._enabled_mask = mask
+        while diff:
+            bit = diff & -diff
+            self._buttons[bit.bit_length() - 1].setEnabled(bool(mask & bit))
+            diff ^= bit
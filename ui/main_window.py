@@ -14,7 +14,7 @@ Layout
 
 from __future__ import annotations
 
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from PyQt5.QtWidgets import (
     QAction, QApplication, QHBoxLayout, QMainWindow,
     QMenu, QMenuBar, QScrollArea, QSplitter, QStatusBar,
@@ -22,7 +22,10 @@ from PyQt5.QtWidgets import (
 )
 
 from core.data_parser import ParsedData
-from core.protocol import Commands
+from core.protocol import (
+    CMD_AUTOTEST, CMD_CALIB, CMD_HRC, CMD_HTC, CMD_POWERSHIELD, CMD_PSRST,
+    CMD_START, CMD_STOP, CMD_TEMP, CMD_VERSION, Commands,
+)
 from core.serial_worker import SerialWorker
 from ui.about_dialog import AboutDialog
 from ui.config_panel import ConfigPanel
@@ -36,6 +39,8 @@ from version import __version__
 
 class MainWindow(QMainWindow):
 
+    _DATA_FLUSH_MS = 16       # max delay before queued data reaches the widgets
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle(f"X-NUCLEO-LPM01A  Power Monitor  v{__version__}")
@@ -50,18 +55,19 @@ class MainWindow(QMainWindow):
         self._worker.data_ready.connect(self._on_data_ready)
         self._worker.acq_changed.connect(self._on_acq_changed)
 
+        # Data results are queued and handed to the widgets once per flush,
+        # so a burst of signals costs one round of widget updates.
+        self._pending: list[ParsedData] = []
+        self._data_timer = QTimer(self)
+        self._data_timer.setSingleShot(True)
+        self._data_timer.setInterval(self._DATA_FLUSH_MS)
+        self._data_timer.timeout.connect(self._flush_data)
+
         # ── Build UI ──────────────────────────────────────────────────────────
         self._build_ui()
         self._wire_signals()
         self._build_menu()
 
-        # ── Periodic plot refresh (50 ms = 20 FPS) ─────────────────────────
-        # The plot widget itself calls _update_curve on add_samples, but we
-        # also need to refresh when samples arrive in bursts.
-        self._plot_timer = QTimer(self)
-        self._plot_timer.setInterval(50)
-        # (No separate timer needed – PlotWidget updates on add_samples)
-
         self._status_bar = QStatusBar()
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Not connected – select a port and click Connect.")
@@ -121,6 +127,8 @@ class MainWindow(QMainWindow):
         plot_stats.setStretchFactor(0, 1)
         plot_stats.setStretchFactor(1, 0)
         plot_stats.setCollapsible(1, False)
+        # Resize the plot once on release, not on every pixel of the drag
+        plot_stats.setOpaqueResize(False)
 
         # Vertical splitter: plot area on top, console on bottom
         vert_splitter = QSplitter(Qt.Vertical)
@@ -130,6 +138,7 @@ class MainWindow(QMainWindow):
         vert_splitter.setSizes([560, 180])
         vert_splitter.setStretchFactor(0, 3)
         vert_splitter.setStretchFactor(1, 1)
+        vert_splitter.setOpaqueResize(False)
 
         right_layout.addWidget(vert_splitter)
 
@@ -148,22 +157,7 @@ class MainWindow(QMainWindow):
         # Control panel
         self.ctrl_panel.start_requested.connect(self._on_start_acquisition)
         self.ctrl_panel.stop_requested.connect(self._on_stop_acquisition)
-        self.ctrl_panel.htc_requested.connect(
-            lambda: self._send(Commands.htc(), "htc")
-        )
-        self.ctrl_panel.hrc_requested.connect(
-            lambda: self._send(Commands.hrc(), "hrc")
-        )
-        self.ctrl_panel.temp_requested.connect(
-            lambda: self._send(Commands.temp("degc"), "temp")
-        )
-        self.ctrl_panel.calib_requested.connect(
-            lambda: self._send(Commands.calib(), "calib")
-        )
-        self.ctrl_panel.autotest_requested.connect(
-            lambda: self._send(Commands.autotest(), "autotest")
-        )
-        self.ctrl_panel.psrst_requested.connect(self._on_psrst)
+        self.ctrl_panel.util_requested.connect(self._on_util_requested)
         self.ctrl_panel.targrst_requested.connect(self._on_targrst)
 
         # Console raw command
@@ -171,9 +165,14 @@ class MainWindow(QMainWindow):
 
         # Stats clear
         self.stats_panel.clear_requested.connect(self.plot_widget.clear)
+        self.plot_widget.window_changed.connect(self.stats_panel.set_window)
+
+        # Plot export
+        self.plot_widget.export_finished.connect(self._on_export_finished)
 
     # ── Serial event handlers ─────────────────────────────────────────────────
 
+    @pyqtSlot(bool, str)
     def _on_conn_changed(self, connected: bool, message: str) -> None:
         self.conn_panel.set_connected(connected, message)
         self.config_panel.set_connected(connected)
@@ -183,17 +182,20 @@ class MainWindow(QMainWindow):
 
         if connected:
             # Auto-probe the device
-            self._send(Commands.powershield(), "powershield")
-            self._send(Commands.version(), "version")
-            self._send(Commands.htc(), "htc")
+            self._send(CMD_POWERSHIELD, "powershield")
+            self._send(CMD_VERSION, "version")
+            self._send(CMD_HTC, "htc")
             self.ctrl_panel.enable_start(True)
         else:
             self.ctrl_panel.enable_start(False)
+            self._flush_data()
             self.stats_panel.stop_acquisition()
 
+    @pyqtSlot(str)
     def _on_log(self, text: str) -> None:
         self.console.append(text)
 
+    @pyqtSlot(bool, str, str)
     def _on_cmd_result(self, success: bool, cmd: str, payload: str) -> None:
         if cmd == "powershield" and success:
             # "PowerShield present XXXXX-XXXXX-XXXXX"
@@ -210,29 +212,53 @@ class MainWindow(QMainWindow):
         label = f"[{prefix}] {cmd} {payload}".strip()
         self._status_bar.showMessage(label, 4000)
 
+    @pyqtSlot(object)
     def _on_data_ready(self, result: ParsedData) -> None:
+        self._pending.append(result)
+        if not self._data_timer.isActive():
+            self._data_timer.start()
+
+    @pyqtSlot()
+    def _flush_data(self) -> None:
+        self._data_timer.stop()
+        if not self._pending:
+            return
+        result = self._pending[0]
+        for other in self._pending[1:]:
+            result.extend(other)
+        self._pending.clear()
+
+        # Timestamps carry their position within this batch of samples
+        first_sample = self.plot_widget._total_samples
         if result.samples:
-            self.plot_widget.add_samples(result.samples)
-            self.stats_panel.add_samples(result.samples)
-
-        for time_ms, buf_pct in result.timestamps:
-            self.plot_widget.add_timestamp(
-                self.plot_widget._total_samples, time_ms
-            )
+            # One array shared by both widgets; neither may modify it
+            samples = result.as_array()
+            samples.flags.writeable = False
+            self.plot_widget.add_samples(samples)
+            self.stats_panel.add_samples(samples)
+
+        if result.timestamps:
+            for time_ms, _, idx in result.timestamps:
+                self.plot_widget.add_timestamp(first_sample + idx, time_ms)
+            # The stats labels only show the latest values
+            time_ms, buf_pct, _ = result.timestamps[-1]
             self.stats_panel.update_buffer(buf_pct)
             self.stats_panel.update_timestamp(time_ms)
 
         if result.overcurrent:
             self.plot_widget.mark_overcurrent()
-            self.console.append("[WARNING] Overcurrent event in data stream!")
-
-        for err in result.errors:
-            self.console.append(f"[Stream error] {err}")
+        if result.overcurrent or result.errors:
+            lines = [f"[Stream error] {err}" for err in result.errors]
+            if result.overcurrent:
+                lines.insert(0, "[WARNING] Overcurrent event in data stream!")
+            self.console.append_lines(lines)
 
         if result.end_of_acquisition:
             self.stats_panel.stop_acquisition()
 
+    @pyqtSlot(bool)
     def _on_acq_changed(self, acquiring: bool) -> None:
+        self._flush_data()
         self.ctrl_panel.set_acquiring(acquiring)
         self.config_panel.set_enabled_controls(not acquiring)
         if acquiring:
@@ -246,16 +272,20 @@ class MainWindow(QMainWindow):
 
     # ── User action handlers ──────────────────────────────────────────────────
 
+    @pyqtSlot(str)
     def _on_connect_requested(self, port: str) -> None:
         self._worker.connect_device(port)
 
+    @pyqtSlot()
     def _on_disconnect_requested(self) -> None:
         self._worker.disconnect_device()
 
+    @pyqtSlot(list)
     def _on_apply_config(self, cmd_list: list[tuple[bytes, str]]) -> None:
         for cmd_bytes, name in cmd_list:
             self._send(cmd_bytes, name)
 
+    @pyqtSlot()
     def _on_start_acquisition(self) -> None:
         # 1. Push all configuration commands
         for cmd_bytes, name in self.config_panel.build_command_list():
@@ -267,23 +297,50 @@ class MainWindow(QMainWindow):
         self.plot_widget.clear()
         self.stats_panel.clear()
         # 4. Fire start
-        self._send(Commands.start(), "start")
+        self._send(CMD_START, "start")
 
+    @pyqtSlot()
     def _on_stop_acquisition(self) -> None:
-        self._send(Commands.stop(), "stop")
+        self._send(CMD_STOP, "stop")
+
+    # Utility commands sent as-is; psrst has its own handler
+    _UTIL_COMMANDS = {
+        "htc": CMD_HTC,
+        "hrc": CMD_HRC,
+        "temp": CMD_TEMP,           # degc
+        "calib": CMD_CALIB,
+        "autotest": CMD_AUTOTEST,   # start
+    }
+
+    @pyqtSlot(str)
+    def _on_util_requested(self, name: str) -> None:
+        if name == "psrst":
+            self._on_psrst()
+        else:
+            self._send(self._UTIL_COMMANDS[name], name)
 
     def _on_psrst(self) -> None:
-        self._send(Commands.psrst(), "psrst")
+        self._send(CMD_PSRST, "psrst")
         QTimer.singleShot(300, self._worker.request_disconnect)
 
+    @pyqtSlot(int)
     def _on_targrst(self, ms: int) -> None:
         self._send(Commands.targrst(ms), "targrst")
 
+    @pyqtSlot(str)
     def _on_raw_command(self, text: str) -> None:
         """Send any raw text typed in the console input."""
         cmd_bytes = (text.strip() + "\n").encode("ascii", errors="replace")
         self._send(cmd_bytes, text.split()[0] if text.split() else text)
 
+    @pyqtSlot(str, str)
+    def _on_export_finished(self, path: str, error: str) -> None:
+        if error:
+            self.console.append(f"[Error] Export to {path} failed: {error}")
+            self._status_bar.showMessage("Export failed.", 4000)
+        else:
+            self._status_bar.showMessage(f"Exported to {path}", 4000)
+
     # ── Helpers ───────────────────────────────────────────────────────────────
 
     def _send(self, cmd_bytes: bytes, name: str = "") -> None:
@@ -5,9 +5,10 @@ Performance design
 ──────────────────
 • _RingBuffer  — pre-allocated numpy array; no Python-object overhead,
                  no full-buffer copy on every update.
-• Dirty flag   — add_samples() only marks new data; a 30 FPS QTimer
-                 drives rendering, completely decoupling data rate from
-                 paint rate.
+• Dirty flag   — add_samples() only marks new data and arms a single-shot
+                 render timer (≤30 FPS, never faster than the display),
+                 decoupling data rate from paint rate; an idle plot
+                 costs no timer wake-ups.
 • Min-max decimation — preserves peaks and valleys that stride decimation
                  silently drops, at no extra cost.
 • antialias=False — software anti-aliasing is expensive at large point
@@ -16,17 +17,34 @@ Performance design
 
 from __future__ import annotations
 
-import csv
 import math
+import time
+from collections import deque
+from typing import Optional
 
 import numpy as np
 import pyqtgraph as pg
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import (
+    QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot,
+)
+from PyQt5.QtGui import (
+    QGuiApplication, QOffscreenSurface, QOpenGLContext, QTransform,
+)
 from PyQt5.QtWidgets import (
     QComboBox, QFileDialog, QHBoxLayout, QLabel,
     QPushButton, QVBoxLayout, QWidget,
 )
 
+from ui.units import current_unit
+
+try:
+    # Present in pyqtgraph releases that stroke curves through Qt's own
+    # OpenGL classes; older releases need PyOpenGL and experimental mode.
+    from pyqtgraph.Qt import OpenGLHelpers  # noqa: F401
+    _HAVE_GL_CURVES = True
+except ImportError:         # optional – the raster viewport is used instead
+    _HAVE_GL_CURVES = False
+
 
 # Colour constants (match dark theme)
 CLR_BG        = "#12121e"
@@ -41,40 +59,83 @@ CLR_OVERCURR  = "#e05050"
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _scale_current(values_a: np.ndarray) -> tuple[np.ndarray, str]:
-    """Return (scaled_array, unit_string) for the most readable unit."""
+_opengl_ok: Optional[bool] = None     # probed once, on first use
+
+
+def _opengl_usable() -> bool:
+    """True if pyqtgraph can draw curves with OpenGL on this display."""
+    global _opengl_ok
+    if _opengl_ok is None:
+        _opengl_ok = False
+        if _HAVE_GL_CURVES:
+            # Remote sessions and some VMs have no usable GL context; an
+            # OpenGL viewport there would stay blank.
+            surface = QOffscreenSurface()
+            surface.create()
+            ctx = QOpenGLContext()
+            if ctx.create() and ctx.makeCurrent(surface):
+                ctx.doneCurrent()
+                _opengl_ok = True
+            surface.destroy()
+    return _opengl_ok
+
+
+def _scale_current(values_a: np.ndarray) -> tuple[float, str]:
+    """Return (scale_factor, unit_string) for the most readable unit."""
     if len(values_a) == 0:
-        return values_a, "µA"
-    peak = float(np.max(np.abs(values_a)))
-    if peak == 0.0 or math.isnan(peak):
-        return values_a * 1e6, "µA"
-    if peak < 1e-6:
-        return values_a * 1e9, "nA"
-    if peak < 1e-3:
-        return values_a * 1e6, "µA"
-    if peak < 1.0:
-        return values_a * 1e3, "mA"
-    return values_a, "A"
+        return 1e6, "µA"
+    # Peak magnitude from the extremes – no |values| temporary needed
+    peak = max(float(values_a.max()), -float(values_a.min()))
+    if math.isnan(peak):
+        return 1e6, "µA"
+    return current_unit(peak)
 
 
 def _minmax_decimate(y: np.ndarray, max_points: int) -> np.ndarray:
     """Decimate by keeping the min and max of each bin.
 
     Unlike stride decimation, this preserves narrow spikes and valleys that
-    would otherwise be lost.  Returns at most max_points points (always even).
+    would otherwise be lost.  Returns a new float32 array of at most
+    max_points points – plenty of precision for pixels, half the bytes.
     """
     n = len(y)
     if n <= max_points:
-        return y
+        return y.astype(np.float32)
     bins = max_points // 2
-    length = (n // bins) * bins          # trim to a whole number of bins
-    grouped = y[:length].reshape(bins, -1)
-    result = np.empty(bins * 2, dtype=y.dtype)
-    result[0::2] = grouped.min(axis=1)
-    result[1::2] = grouped.max(axis=1)
+    result = np.empty(bins * 2, dtype=np.float32)
+    # The remainder is spread over the bins, so the newest samples are
+    # never dropped and bin widths differ by at most one sample.
+    edges = np.arange(bins) * n // bins
+    result[0::2] = np.minimum.reduceat(y, edges)
+    result[1::2] = np.maximum.reduceat(y, edges)
     return result
 
 
+# index, time_s, current_A with the csv module's \r\n line endings
+_CSV_ROW   = "%d,%.9f,%.9e\r\n"
+_CSV_CHUNK = 16384          # rows formatted per write (keeps GIL hand-offs short)
+
+# Save-dialog file types; the chosen one supplies a missing suffix
+_CSV_FILTER = "CSV files (*.csv)"
+_NPY_FILTER = "NumPy array (*.npy)"
+
+
+def _write_csv(path: str, data: np.ndarray, rate_hz: float) -> None:
+    """Write index, time and current columns to a CSV file.
+
+    Rows are %-formatted from plain Python floats a chunk at a time, which
+    is about twice as fast as np.savetxt's per-row NumPy scalar handling.
+    """
+    t = np.arange(len(data)) * (1.0 / rate_hz)     # i * dt
+    fmt = _CSV_ROW.__mod__
+    with open(path, "w", newline="") as f:
+        f.write("index,time_s,current_A\r\n")
+        for i in range(0, len(data), _CSV_CHUNK):
+            j = min(i + _CSV_CHUNK, len(data))
+            rows = zip(range(i, j), t[i:j].tolist(), data[i:j].tolist())
+            f.write("".join(map(fmt, rows)))
+
+
 # ---------------------------------------------------------------------------
 # Ring buffer
 # ---------------------------------------------------------------------------
@@ -85,10 +146,14 @@ class _RingBuffer:
     Avoids the per-element Python object overhead of a deque[float] and
     allows zero-copy slicing of the tail (window) without touching the
     rest of the buffer.
+
+    The plot keeps its copy as float32, which halves the memory and the
+    copy and decimation traffic of the render path; exports read a
+    float64 copy so saved values keep full precision.
     """
 
-    def __init__(self, maxsize: int) -> None:
-        self._buf    = np.empty(maxsize, dtype=np.float64)
+    def __init__(self, maxsize: int, dtype=np.float64) -> None:
+        self._buf    = np.empty(maxsize, dtype=dtype)
         self._maxsize = maxsize
         self._write  = 0   # index of the next write position
         self._count  = 0   # number of valid samples (≤ maxsize)
@@ -100,37 +165,44 @@ class _RingBuffer:
         if n == 0:
             return
         if n >= self._maxsize:
-            # Incoming data fills or overflows the entire buffer
-            self._buf[:] = data[-self._maxsize:]
+            # Incoming data fills or overflows the entire buffer; only the
+            # part that survives is copied
+            np.copyto(self._buf, data[-self._maxsize:])
             self._write  = 0
             self._count  = self._maxsize
             return
         end = self._write + n
         if end <= self._maxsize:
-            self._buf[self._write:end] = data
+            np.copyto(self._buf[self._write:end], data)
         else:
             split = self._maxsize - self._write
-            self._buf[self._write:] = data[:split]
-            self._buf[:end - self._maxsize] = data[split:]
+            np.copyto(self._buf[self._write:], data[:split])
+            np.copyto(self._buf[:end - self._maxsize], data[split:])
         self._write = end % self._maxsize
         self._count = min(self._count + n, self._maxsize)
 
     # -- read -----------------------------------------------------------------
 
     def tail(self, n: int) -> np.ndarray:
-        """Return the last n samples as a contiguous array (copy)."""
+        """Return the last n samples as a contiguous, read-only array.
+
+        This is a view into the buffer unless the window wraps around, so
+        it is only valid until the next extend().
+        """
         n = min(n, self._count)
         if n == 0:
-            return np.empty(0, dtype=np.float64)
-        end   = self._write
-        start = (end - n) % self._maxsize
-        if start < end:
-            return self._buf[start:end].copy()
+            return np.empty(0, dtype=self._buf.dtype)
+        end   = self._write or self._maxsize    # 0 once full: data ends at the top
+        start = end - n
+        if start >= 0:
+            view = self._buf[start:end]
+            view.flags.writeable = False
+            return view
         return np.concatenate((self._buf[start:], self._buf[:end]))
 
     def all(self) -> np.ndarray:
-        """Return every valid sample in chronological order (copy)."""
-        return self.tail(self._count)
+        """Return every valid sample in chronological order (a copy)."""
+        return self.tail(self._count).copy()
 
     # -- misc -----------------------------------------------------------------
 
@@ -142,6 +214,39 @@ class _RingBuffer:
         self._count = 0
 
 
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+class _ExportSignals(QObject):
+    finished = pyqtSignal(str, str)     # path, error message ("" on success)
+
+
+class _ExportTask(QRunnable):
+    """Writes a snapshot of the buffer to disk on a thread-pool thread."""
+
+    def __init__(self, path: str, data: np.ndarray, rate_hz: float) -> None:
+        super().__init__()
+        self.signals  = _ExportSignals()
+        self._path    = path
+        self._data    = data        # private copy, not shared with the ring
+        self._rate_hz = rate_hz
+
+    def run(self) -> None:
+        error = ""
+        try:
+            if self._path.lower().endswith(".npy"):
+                # Raw samples in amperes; time is index / sample rate.
+                np.save(self._path, self._data)
+            else:
+                _write_csv(self._path, self._data, self._rate_hz)
+        except Exception as exc:    # reported to the user, never swallowed
+            error = str(exc) or type(exc).__name__
+        finally:
+            # Always signal, so the widget re-enables its export button
+            self.signals.finished.emit(self._path, error)
+
+
 # ---------------------------------------------------------------------------
 # Widget
 # ---------------------------------------------------------------------------
@@ -149,27 +254,46 @@ class _RingBuffer:
 class PlotWidget(QWidget):
     """pyqtgraph real-time waveform with rate-limited rendering."""
 
-    MAX_BUFFER  = 5_000_000   # samples kept in ring buffer (~40 MB)
+    export_finished = pyqtSignal(str, str)  # path, error message ("" on success)
+    window_changed  = pyqtSignal(int)       # samples in the window (0 = all)
+
+    MAX_BUFFER  = 5_000_000   # samples kept (~20 MB plotted + ~40 MB for export)
     MAX_DISPLAY = 10_000      # points sent to renderer per frame
-    _REFRESH_MS = 33          # render timer interval (~30 FPS)
+    _REFRESH_MS = 33          # min render interval (~30 FPS)
+    _MAX_STALE_S = 0.25       # sub-pixel updates are still drawn this often
+    MAX_TS_LINES = 64         # timestamp markers kept on the plot
+
+    # Marker label options, shared by every marker line
+    _TS_LABEL_OPTS = {"color": CLR_TIMESTAMP, "position": 0.9}
+    _OC_LABEL_OPTS = {"color": CLR_OVERCURR, "position": 0.7}
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        self._ring           = _RingBuffer(self.MAX_BUFFER)
+        self._ring           = _RingBuffer(self.MAX_BUFFER, np.float32)
+        self._export_ring    = _RingBuffer(self.MAX_BUFFER)
         self._sample_rate_hz = 100.0
         self._total_samples  = 0
         self._dirty          = False   # True when unrendered data exists
-
-        self._ts_markers: list[tuple[int, int]] = []
+        self._force_render   = False   # next render must not be skipped
+        self._painted_total  = 0       # _total_samples at the last render …
+        self._painted_at     = 0.0     # … and when it happened (monotonic)
+        self._unit           = "µA"    # unit currently shown on the y axis
+        self._export_task: Optional[_ExportTask] = None   # export in flight
 
         self._build_ui()
 
-        # Render timer — fires at ~30 FPS, redraws only when data changed
+        # Render timer — armed when data arrives, so bursts within one
+        # frame coalesce into a single redraw.
+        screen = QGuiApplication.primaryScreen()
+        refresh_hz = screen.refreshRate() if screen else 0.0
+        interval = self._REFRESH_MS
+        if refresh_hz > 0:
+            interval = max(interval, math.ceil(1000 / refresh_hz))
         self._render_timer = QTimer(self)
-        self._render_timer.setInterval(self._REFRESH_MS)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(interval)
         self._render_timer.timeout.connect(self._maybe_update_curve)
-        self._render_timer.start()
 
     # ── UI ────────────────────────────────────────────────────────────────────
 
@@ -196,7 +320,7 @@ class PlotWidget(QWidget):
             self.window_combo.addItem(label, n)
         self.window_combo.setCurrentIndex(0)
         self.window_combo.setToolTip("Number of samples visible in the plot")
-        self.window_combo.currentIndexChanged.connect(self._force_update)
+        self.window_combo.currentIndexChanged.connect(self._on_window_changed)
         toolbar.addWidget(self.window_combo)
 
         toolbar.addSpacing(12)
@@ -210,8 +334,8 @@ class PlotWidget(QWidget):
 
         toolbar.addStretch()
 
-        self.export_btn = QPushButton("Export CSV")
-        self.export_btn.setToolTip("Save current buffer to a CSV file")
+        self.export_btn = QPushButton("Export…")
+        self.export_btn.setToolTip("Save current buffer to CSV or NumPy .npy")
         self.export_btn.clicked.connect(self._on_export)
         toolbar.addWidget(self.export_btn)
 
@@ -223,11 +347,12 @@ class PlotWidget(QWidget):
         root.addLayout(toolbar)
 
         # pyqtgraph canvas — antialias off for the waveform (too costly at
-        # high point counts); axes and labels remain sharp regardless.
-        pg.setConfigOptions(antialias=False, useOpenGL=False)
+        # high point counts); axes and labels remain sharp regardless.  The
+        # curve is stroked on the GPU where pyqtgraph supports it.
+        pg.setConfigOptions(antialias=False, useOpenGL=_opengl_usable())
         self._pw = pg.PlotWidget()
         self._pw.setBackground(CLR_BG)
-        self._pw.showGrid(x=True, y=True)
+        self._pw.showGrid(x=True, y=True, alpha=60 / 255)   # solid, faint lines
         self._pw.getAxis("bottom").setTextPen(CLR_AXIS)
         self._pw.getAxis("left").setTextPen(CLR_AXIS)
         self._pw.getAxis("bottom").setPen(CLR_AXIS)
@@ -235,14 +360,23 @@ class PlotWidget(QWidget):
         self._pw.getAxis("bottom").setLabel("Time", units="s", color=CLR_AXIS)
         self._pw.getAxis("left").setLabel("Current", units="µA", color=CLR_AXIS)
         self._pw.setMouseEnabled(x=True, y=True)
-        self._pw.getAxis("bottom").setGrid(60)
-        self._pw.getAxis("left").setGrid(60)
 
         self._curve = self._pw.plot(
             pen=pg.mkPen(color=CLR_CURVE, width=1.2),
         )
-
-        self._ts_lines: list[pg.InfiniteLine] = []
+        self._curve.setSkipFiniteCheck(True)   # decoded samples are always finite
+        # Hand-set x range the last frame was clipped to (None: auto range)
+        self._clip_range: Optional[tuple[float, float]] = None
+        self._pw.getViewBox().sigStateChanged.connect(self._on_view_changed)
+
+        # Timestamp markers on the plot (oldest first) and markers taken
+        # off by clear(), kept for reuse.  All share one pen.
+        self._ts_pen = pg.mkPen(color=CLR_TIMESTAMP, width=1, style=Qt.DashLine)
+        self._ts_lines: deque[pg.InfiniteLine] = deque()
+        self._ts_spare: list[pg.InfiniteLine] = []
+        self._ts_first_label = ""      # label of the newest marker …
+        self._ts_merged      = 0       # … and how many timestamps it stands for
+        self._oc_pen = pg.mkPen(color=CLR_OVERCURR, width=2)
 
         root.addWidget(self._pw, 1)
 
@@ -251,25 +385,44 @@ class PlotWidget(QWidget):
     def set_sample_rate(self, hz: float) -> None:
         self._sample_rate_hz = max(hz, 1e-3)
 
-    def add_samples(self, samples: list[float]) -> None:
-        """Buffer incoming samples; do NOT redraw here."""
-        if not samples:
+    def add_samples(self, samples: np.ndarray) -> None:
+        """Buffer incoming samples (float64 A, read-only); do NOT redraw here."""
+        if len(samples) == 0:
             return
-        self._ring.extend(np.asarray(samples, dtype=np.float64))
+        self._ring.extend(samples)
+        self._export_ring.extend(samples)
         self._total_samples += len(samples)
-        self._dirty = True
+        self._mark_dirty()
 
     def add_timestamp(self, sample_idx: int, time_ms: int) -> None:
-        self._ts_markers.append((sample_idx, time_ms))
         x = sample_idx / self._sample_rate_hz
-        line = pg.InfiniteLine(
-            pos=x,
-            angle=90,
-            pen=pg.mkPen(color=CLR_TIMESTAMP, width=1, style=Qt.DashLine),
-            label=f"{time_ms / 1000:.1f}s",
-            labelOpts={"color": CLR_TIMESTAMP, "position": 0.9},
-        )
-        self._pw.addItem(line)
+        if self._ts_lines:
+            # Less than a pixel from the newest marker at the current zoom:
+            # count it on that marker instead of stacking another line.
+            px_w = self._pw.getViewBox().viewPixelSize()[0]
+            if x - self._ts_lines[-1].value() < px_w:
+                self._ts_merged += 1
+                self._ts_lines[-1].label.setFormat(
+                    f"{self._ts_first_label} ×{self._ts_merged}"
+                )
+                return
+        if len(self._ts_lines) >= self.MAX_TS_LINES:
+            line = self._ts_lines.popleft()     # recycle the oldest marker
+        else:
+            if self._ts_spare:
+                line = self._ts_spare.pop()
+            else:
+                line = pg.InfiniteLine(
+                    angle=90,
+                    pen=self._ts_pen,
+                    label="",
+                    labelOpts=self._TS_LABEL_OPTS,
+                )
+            self._pw.addItem(line)
+        self._ts_first_label = f"{time_ms / 1000:.1f}s"
+        self._ts_merged = 1
+        line.setPos(x)
+        line.label.setFormat(self._ts_first_label)
         self._ts_lines.append(line)
 
     def mark_overcurrent(self) -> None:
@@ -277,33 +430,83 @@ class PlotWidget(QWidget):
         line = pg.InfiniteLine(
             pos=x,
             angle=90,
-            pen=pg.mkPen(color=CLR_OVERCURR, width=2),
+            pen=self._oc_pen,
             label="OC!",
-            labelOpts={"color": CLR_OVERCURR, "position": 0.7},
+            labelOpts=self._OC_LABEL_OPTS,
         )
         self._pw.addItem(line)
 
     def clear(self) -> None:
         self._ring.clear()
+        self._export_ring.clear()
         self._total_samples = 0
-        self._ts_markers.clear()
         for line in self._ts_lines:
             self._pw.removeItem(line)
+        self._ts_spare.extend(self._ts_lines)
         self._ts_lines.clear()
         self._curve.setData([], [])
         self._dirty = False
+        self._painted_total = 0
+
+    # ── Qt events ─────────────────────────────────────────────────────────────
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._dirty:
+            self._render_timer.start()      # catch up on data that arrived hidden
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        if len(self._ring):
+            self._mark_dirty(force=True)    # the point budget follows the pixel width
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _force_update(self) -> None:
-        """Trigger an immediate repaint (e.g. when the window selector changes)."""
+        """Trigger a repaint (e.g. when the window selector changes)."""
+        self._mark_dirty(force=True)
+
+    def _on_window_changed(self, _index: int) -> None:
+        self._force_update()
+        self.window_changed.emit(self.window_combo.currentData() or 0)
+
+    def _on_view_changed(self, *_) -> None:
+        # Only a new hand-set x range (or leaving one) changes what gets
+        # decimated; an auto range just follows the data already drawn.
+        vb = self._pw.getViewBox()
+        if vb.autoRangeEnabled()[0]:
+            changed = self._clip_range is not None
+        else:
+            changed = tuple(vb.viewRange()[0]) != self._clip_range
+        if changed and len(self._ring):
+            self._mark_dirty(force=True)
+
+    def _mark_dirty(self, force: bool = False) -> None:
         self._dirty = True
+        self._force_render |= force
+        if not self._render_timer.isActive():
+            self._render_timer.start()
 
     def _maybe_update_curve(self) -> None:
         """Timer slot: skip the paint entirely if nothing changed."""
         if not self._dirty:
             return
+        if self._pw.viewport().visibleRegion().isEmpty():
+            return      # hidden or collapsed – stay dirty until shown again
+        if not self._force_render:
+            # New samples that would move the curve by under half a pixel
+            # wait for more (bounded by _MAX_STALE_S so the tail shows up)
+            window = self.window_combo.currentData() or 0
+            shown = min(window, len(self._ring)) if window > 0 else len(self._ring)
+            new = self._total_samples - self._painted_total
+            px = new * self._pw.getViewBox().width() / max(shown, 1)
+            if px < 0.5 and time.monotonic() - self._painted_at < self._MAX_STALE_S:
+                self._render_timer.start()
+                return
         self._dirty = False
+        self._force_render = False
+        self._painted_total = self._total_samples
+        self._painted_at = time.monotonic()
         self._update_curve()
 
     def _update_curve(self) -> None:
@@ -313,19 +516,42 @@ class PlotWidget(QWidget):
         y_raw = self._ring.tail(n_wanted)
         if len(y_raw) == 0:
             return
-
-        y_dec    = _minmax_decimate(y_raw, self.MAX_DISPLAY)
-        y_scaled, unit = _scale_current(y_dec)
-
         start_sample = self._total_samples - len(y_raw)
-        x = np.linspace(
-            start_sample / self._sample_rate_hz,
-            self._total_samples / self._sample_rate_hz,
-            len(y_scaled),
-        )
 
-        self._curve.setData(x, y_scaled)
-        self._pw.getAxis("left").setLabel("Current", units=unit, color=CLR_AXIS)
+        vb = self._pw.getViewBox()
+        self._clip_range = None
+        if not vb.autoRangeEnabled()[0]:
+            # Zoomed or panned by hand: decimate only what is in view (plus
+            # one sample either side so the line reaches the edges).
+            (t0, t1), _ = vb.viewRange()
+            self._clip_range = (t0, t1)
+            rate = self._sample_rate_hz
+            lo = max(math.floor(t0 * rate) - start_sample - 1, 0)
+            hi = min(math.ceil(t1 * rate) - start_sample + 2, len(y_raw))
+            if hi - lo >= 2:
+                y_raw = y_raw[lo:hi]
+                start_sample += lo
+
+        # Two points (min and max) per pixel column is all that can show
+        width_px = vb.width() * self.devicePixelRatioF()
+        max_points = min(self.MAX_DISPLAY, max(2 * int(width_px), 2))
+
+        y_dec = _minmax_decimate(y_raw, max_points)
+        factor, unit = _scale_current(y_dec)
+
+        # Plot amperes against the point index and let the item transform
+        # map them onto the time axis and the display unit, instead of
+        # building an x array and scaling y every frame.
+        x0 = start_sample / self._sample_rate_hz
+        x1 = (start_sample + len(y_raw)) / self._sample_rate_hz
+        n  = len(y_dec)
+        dx = (x1 - x0) / (n - 1) if n > 1 else 1.0
+
+        self._curve.setData(y_dec)
+        self._curve.setTransform(QTransform(dx, 0.0, 0.0, factor, x0, 0.0))
+        if unit != self._unit:      # relabelling relayouts the axis
+            self._unit = unit
+            self._pw.getAxis("left").setLabel("Current", units=unit, color=CLR_AXIS)
 
         if self.autorange_btn.isChecked():
             self._pw.enableAutoRange(axis="y")
@@ -333,15 +559,22 @@ class PlotWidget(QWidget):
     # ── Export ────────────────────────────────────────────────────────────────
 
     def _on_export(self) -> None:
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Export CSV", "", "CSV files (*.csv)"
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export data", "", f"{_CSV_FILTER};;{_NPY_FILTER}",
         )
         if not path:
             return
-        data = self._ring.all()
-        dt   = 1.0 / self._sample_rate_hz
-        with open(path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["index", "time_s", "current_A"])
-            for i, v in enumerate(data):
-                writer.writerow([i, f"{i * dt:.9f}", f"{v:.9e}"])
+        if not path.lower().endswith((".csv", ".npy")):
+            path += ".npy" if selected == _NPY_FILTER else ".csv"
+        # Snapshot here; formatting and file I/O run off the GUI thread
+        task = _ExportTask(path, self._export_ring.all(), self._sample_rate_hz)
+        task.signals.finished.connect(self._on_export_finished)
+        self._export_task = task
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(str, str)
+    def _on_export_finished(self, path: str, error: str) -> None:
+        self._export_task = None
+        self.export_btn.setEnabled(True)
+        self.export_finished.emit(path, error)
@@ -6,26 +6,80 @@ from __future__ import annotations
 
 import math
 import time
+from collections import deque
 
+import numpy as np
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QFrame, QGridLayout, QGroupBox, QHBoxLayout,
     QLabel, QPushButton, QVBoxLayout, QWidget,
 )
 
+from ui.units import current_unit
+
 
 def _format_current(value_a: float) -> tuple[float, str]:
     """Scale a current value in Amperes to the most readable unit."""
-    if value_a == 0.0:
-        return 0.0, "µA"
-    abs_v = abs(value_a)
-    if abs_v < 1e-6:
-        return value_a * 1e9, "nA"
-    if abs_v < 1e-3:
-        return value_a * 1e6, "µA"
-    if abs_v < 1.0:
-        return value_a * 1e3, "mA"
-    return value_a, "A"
+    factor, unit = current_unit(abs(value_a))
+    return value_a * factor, unit
+
+
+class _WindowedExtrema:
+    """Min / max over the last N samples, kept up to date batch by batch.
+
+    Each batch is pushed once onto two monotonic deques (rising minima,
+    falling maxima), so a query only looks at the first live entry of each.
+    Only a batch straddling the window start is reduced again, over its
+    in-window part.
+    """
+
+    def __init__(self, keep: int) -> None:
+        self._keep = keep          # longest window that can be queried
+        self._count = 0
+        # (end index, extreme, start index, batch)
+        self._mins: deque[tuple[int, float, int, np.ndarray]] = deque()
+        self._maxs: deque[tuple[int, float, int, np.ndarray]] = deque()
+
+    def push(self, samples: np.ndarray, lo: float, hi: float) -> None:
+        """Add a non-empty batch whose min and max are lo and hi."""
+        start = self._count
+        self._count = end = start + samples.size
+        while self._mins and self._mins[-1][1] >= lo:
+            self._mins.pop()
+        self._mins.append((end, lo, start, samples))
+        while self._maxs and self._maxs[-1][1] <= hi:
+            self._maxs.pop()
+        self._maxs.append((end, hi, start, samples))
+        # The newest entry always survives: its end is past the horizon
+        horizon = end - self._keep
+        while self._mins[0][0] <= horizon:
+            self._mins.popleft()
+        while self._maxs[0][0] <= horizon:
+            self._maxs.popleft()
+
+    def extrema(self, window: int) -> tuple[float, float]:
+        """Return (min, max) of the last `window` samples; needs data."""
+        first = self._count - min(window, self._keep)
+        return (
+            self._front(self._mins, first, np.min, min),
+            self._front(self._maxs, first, np.max, max),
+        )
+
+    @staticmethod
+    def _front(entries, first, reduce, pick) -> float:
+        # Entries that ended before `first` are skipped, not dropped: a
+        # longer window may still need them
+        it = iter(entries)
+        for end, value, start, batch in it:
+            if end > first:
+                break
+        if start >= first:
+            return value
+        # Later entries all lie inside the window and the next one is the
+        # best of them; this one only counts from `first` on
+        partial = float(reduce(batch[first - start:]))
+        nxt = next(it, None)
+        return partial if nxt is None else pick(partial, nxt[1])
 
 
 class StatsPanel(QGroupBox):
@@ -33,8 +87,11 @@ class StatsPanel(QGroupBox):
 
     clear_requested = pyqtSignal()
 
+    WINDOW_KEEP = 100_000   # longest plot window min / max can follow
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Statistics", parent)
+        self._window = 0        # min / max over the last N samples (0 = all)
         self._reset_state()
         self._build_ui()
 
@@ -49,9 +106,12 @@ class StatsPanel(QGroupBox):
         self._total = 0.0
         self._min = math.inf
         self._max = -math.inf
+        self._recent = _WindowedExtrema(self.WINDOW_KEEP)
+        self._last_value = 0.0
         self._buf_pct = 0
         self._last_time_ms = 0
         self._start_wall = 0.0
+        self._dirty = True        # value labels out of date
 
     # ── UI construction ────────────────────────────────────────────────────────
 
@@ -64,9 +124,12 @@ class StatsPanel(QGroupBox):
         grid.setSpacing(4)
         grid.setColumnStretch(1, 1)
 
+        captions: list[QLabel] = []
+
         def _row(r: int, label: str) -> QLabel:
             lbl = QLabel(label)
             lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            captions.append(lbl)
             val = QLabel("–")
             val.setObjectName("stat_value")
             grid.addWidget(lbl, r, 0)
@@ -81,6 +144,9 @@ class StatsPanel(QGroupBox):
         self.elapsed_lbl = _row(5, "Elapsed:")
         self.buf_lbl     = _row(6, "Buffer:")
 
+        # Min / max follow the plot window; their captions say so (set_window)
+        self._min_caption, self._max_caption = captions[1], captions[2]
+
         # Make the "Current" label bigger for live readout
         self.current_lbl.setObjectName("value_display")
         self.current_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
@@ -108,25 +174,39 @@ class StatsPanel(QGroupBox):
         self._timer.stop()
         self._refresh_labels()
 
-    def add_samples(self, samples: list[float]) -> None:
-        if not samples:
+    def add_samples(self, samples: np.ndarray) -> None:
+        """Fold a batch (float64 amperes, read-only) into the running stats."""
+        if len(samples) == 0:
             return
-        for v in samples:
-            self._count += 1
-            self._total += v
-            if v < self._min:
-                self._min = v
-            if v > self._max:
-                self._max = v
+        self._count += samples.size
+        self._total += float(samples.sum())
+        lo = float(samples.min())
+        hi = float(samples.max())
+        self._min = min(self._min, lo)
+        self._max = max(self._max, hi)
+        self._recent.push(samples, lo, hi)
         # Update live current from the last sample
-        self._last_value = samples[-1]
+        self._last_value = float(samples[-1])
+        self._dirty = True
 
     def update_buffer(self, buf_pct: int) -> None:
-        self._buf_pct = buf_pct
+        if buf_pct != self._buf_pct:
+            self._buf_pct = buf_pct
+            self._dirty = True
 
     def update_timestamp(self, time_ms: int) -> None:
         self._last_time_ms = time_ms
 
+    def set_window(self, window: int) -> None:
+        """Follow the plot window: min / max over its last `window` samples."""
+        self._window = window
+        scope = " (window)" if window else ""
+        self._min_caption.setText(f"Min{scope}:")
+        self._max_caption.setText(f"Max{scope}:")
+        self._dirty = True
+        if not self._timer.isActive():
+            self._refresh_labels()
+
     def clear(self) -> None:
         self._reset_state()
         self._refresh_labels()
@@ -140,26 +220,36 @@ class StatsPanel(QGroupBox):
     # ── Label refresh ──────────────────────────────────────────────────────────
 
     def _refresh_labels(self) -> None:
+        """Tick the elapsed time; reformat the rest only after new data."""
         if self._count == 0:
-            for lbl in (
-                self.current_lbl, self.min_lbl, self.max_lbl,
-                self.mean_lbl, self.count_lbl, self.elapsed_lbl, self.buf_lbl,
-            ):
-                lbl.setText("–")
+            if self._dirty:
+                for lbl in (
+                    self.current_lbl, self.min_lbl, self.max_lbl,
+                    self.mean_lbl, self.count_lbl, self.elapsed_lbl, self.buf_lbl,
+                ):
+                    lbl.setText("–")
+                self._dirty = False
+            return
+
+        elapsed = time.monotonic() - self._start_wall
+        self.elapsed_lbl.setText(f"{elapsed:.1f} s")
+        if not self._dirty:
             return
+        self._dirty = False
 
-        val, unit = _format_current(getattr(self, "_last_value", 0.0))
+        val, unit = _format_current(self._last_value)
         self.current_lbl.setText(f"{val:+.3f} {unit}")
 
-        mn, mn_u = _format_current(self._min)
-        mx, mx_u = _format_current(self._max)
+        if self._window:
+            lo, hi = self._recent.extrema(self._window)
+        else:
+            lo, hi = self._min, self._max
+        mn, mn_u = _format_current(lo)
+        mx, mx_u = _format_current(hi)
         mean, mean_u = _format_current(self._total / self._count)
 
         self.min_lbl.setText(f"{mn:.4f} {mn_u}")
         self.max_lbl.setText(f"{mx:.4f} {mx_u}")
         self.mean_lbl.setText(f"{mean:.4f} {mean_u}")
         self.count_lbl.setText(f"{self._count:,}")
-
-        elapsed = time.monotonic() - self._start_wall
-        self.elapsed_lbl.setText(f"{elapsed:.1f} s")
         self.buf_lbl.setText(f"{self._buf_pct} %")
@@ -190,7 +190,7 @@ QLabel#status_err { color: #e05050; font-weight: 700; }
 QLabel#status_warn{ color: #e0a020; font-weight: 700; }
 
 /* ── TextEdit / console ─────────────────────────────────────────────────── */
-QTextEdit {
+QTextEdit, QPlainTextEdit {
     background-color: #0d1018;
     color: #9db8c0;
     border: 1px solid #1e2a40;
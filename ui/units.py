@@ -0,0 +1,29 @@
+"""Current units shared by the plot and the statistics panel."""
+
+from __future__ import annotations
+
+import math
+
+# (lower bound in A, scale factor, unit), one entry per three decades
+_UNITS = (
+    (0.0,  1e9, "nA"),
+    (1e-6, 1e6, "µA"),
+    (1e-3, 1e3, "mA"),
+    (1.0,  1.0, "A"),
+)
+
+
+def current_unit(magnitude_a: float) -> tuple[float, str]:
+    """Return (scale_factor, unit_string) for a current magnitude in Amperes.
+
+    Zero reads in µA; infinite and NaN magnitudes fall through to A.
+    """
+    if magnitude_a == 0.0:
+        return 1e6, "µA"
+    if not math.isfinite(magnitude_a):
+        return 1.0, "A"
+    idx = min(max((math.floor(math.log10(magnitude_a)) + 9) // 3, 0), 3)
+    if magnitude_a < _UNITS[idx][0]:   # log10 rounds up just below a power of ten
+        idx -= 1
+    _, factor, unit = _UNITS[idx]
+    return factor, unit